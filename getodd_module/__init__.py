@@ -9,7 +9,7 @@ __version__ = "1.0.0"
 __author__ = "GetOdd Team"
 
 # Import key functions for external use
-from .scraper import scrape_match_and_odds, create_driver
+from .scraper import scrape_match_and_odds, create_driver, ScraperSession
 from .processor import process_csv_file, process_url_batch
 from .parser import parse_url_for_info
 from .utils import setup_logging, find_csv_files
@@ -17,6 +17,7 @@ from .utils import setup_logging, find_csv_files
 __all__ = [
     'scrape_match_and_odds',
     'create_driver',
+    'ScraperSession',
     'process_csv_file',
     'process_url_batch',
     'parse_url_for_info',
@@ -4,10 +4,42 @@ Configuration settings for the odds scraper
 
 # Browser configuration
 BROWSER_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-BROWSER_TIMEOUT = 20
+BROWSER_TIMEOUT = 15  # essential elements (team names, odds table)
+PAGE_LOAD_TIMEOUT = 15
+OPTIONAL_ELEMENT_TIMEOUT = 3  # elements that may legitimately be missing (e.g. a handicap row)
+WAIT_POLL_FREQUENCY = 0.1  # WebDriverWait poll interval (Selenium default is 0.5s)
 WAIT_DELAY = 0.5
-SCROLL_PAUSE = 1
-EXPAND_PAUSE = 2
+RETRY_BACKOFF_BASE = 1  # seconds; retries use decorrelated jitter between base and 3x the previous wait
+RETRY_BACKOFF_CAP = 30
+
+# Progress summary: one INFO line every N finished URLs or every N seconds
+PROGRESS_LOG_EVERY = 100
+PROGRESS_LOG_INTERVAL = 60
+
+# URL tasks submitted ahead of the one being written, per pool driver (bounds results held in memory)
+MAX_PENDING_PER_WORKER = 2
+
+# Resources blocked via CDP Network.setBlockedURLs (only DOM text is scraped).
+# Stylesheets are left alone: visibility/clickability waits depend on layout.
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.mp3",
+    "*google-analytics*", "*googletagmanager*", "*/gtag/*", "*doubleclick*", "*facebook*"
+]
+
+# Per-worker Chrome profile (reused across driver restarts so the HTTP cache survives)
+CHROME_PROFILE_PREFIX = 'getodd-cache-'
+CHROME_DISK_CACHE_SIZE = 100 * 1024 * 1024
+# Throwaway profiles (deleted on quit) go on tmpfs when it has this much free space (Docker's default /dev/shm is only 64MB)
+CHROME_PROFILE_TMPFS = '/dev/shm'
+CHROME_PROFILE_TMPFS_MIN_FREE = 1024 * 1024 * 1024
+
+# urllib3 connections kept per chromedriver (the default of 1 drops and reopens extra connections)
+CHROMEDRIVER_POOL_MAXSIZE = 10
+
+# DriverPool: drivers idle longer than this (seconds) are health-checked before reuse
+POOL_HEALTH_CHECK_IDLE = 30
 
 # Default CLI arguments
 DEFAULT_HANDICAPS = '+2.5,+3,+3.5'
@@ -45,12 +77,16 @@ CSV_COLUMNS = [
     'match_url'
 ]
 
+# Cookie set by the OneTrust banner once consent is given
+CONSENT_COOKIE_NAME = 'OptanonAlertBoxClosed'
+
 # XPath selectors
 XPATH_SELECTORS = {
     'cookie_button': "onetrust-accept-btn-handler",
     'home_team': "//div[@data-testid='game-host']/p",
     'away_team': "//div[@data-testid='game-guest']/p",
     'time_container': "//div[@data-testid='game-time-item']",
+    'over_under_rows': "//div[contains(@class, 'h-9') and .//p[starts-with(normalize-space(.), 'Over/Under')]]",
     'target_row': "//div[contains(@class, 'h-9') and .//p[normalize-space(.)='Over/Under {}']]",
     'expanded_container': "{}/following-sibling::div[1]",
     'bookmaker_rows': "{}//div[contains(@data-testid, 'expanded-row')]",
@@ -3,7 +3,6 @@ Main CLI entry point for the odds scraper
 """
 
 import argparse
-import pandas as pd
 from pathlib import Path
 
 from .config import (
@@ -13,10 +12,11 @@ from .config import (
 )
 from .utils import (
     setup_logging, find_csv_files, load_checkpoint, 
-    save_checkpoint, save_failed_urls
+    save_checkpoint, append_checkpoint_event, save_failed_urls
 )
-from .processor import process_csv_file, save_results_to_csv
+from .processor import process_csv_files
 from .scraper import cleanup_chromedriver_processes
+from .pool import DriverPool
 
 
 def parse_arguments():
@@ -97,50 +97,53 @@ def main():
     # 체크포인트 처리
     checkpoint_file = output_dir / CHECKPOINT_FILE
     checkpoint_data = load_checkpoint(checkpoint_file) if args.resume else {'processed_files': [], 'failed_urls': []}
+    # 스냅샷으로 정리하고 이벤트 로그를 비움 (새 실행이면 이전 체크포인트 초기화)
+    save_checkpoint(checkpoint_file, checkpoint_data)
     
     # 이미 처리된 파일 필터링
     if args.resume and checkpoint_data['processed_files']:
-        processed_set = set(checkpoint_data['processed_files'])
-        csv_files = [f for f in csv_files if str(f) not in processed_set]
+        # 구분자를 '/'로 통일하여 비교 (Windows에서 저장된 체크포인트 포함)
+        processed_set = {p.replace('\\', '/') for p in checkpoint_data['processed_files']}
+        csv_files = [f for f in csv_files if f.as_posix() not in processed_set]
         logger.info(f"Resuming: {len(processed_set)} files already processed, {len(csv_files)} remaining")
     
     # 실패한 URL 저장용
     all_failed_urls = checkpoint_data.get('failed_urls', [])
     
-    # 각 CSV 파일 처리
-    for idx, csv_file in enumerate(csv_files, 1):
-        logger.info(f"\n[{idx}/{len(csv_files)}] Processing: {csv_file}")
-        
-        # CSV 파일 처리
-        results, failed_urls = process_csv_file(
-            csv_file, handicaps, output_dir, logger, 
-            headless=not args.no_headless,
-            num_workers=args.workers
-        )
-        
-        # 결과 저장
-        if results:
-            # 리그별 저장 디렉토리 생성
-            try:
-                relative_path = csv_file.relative_to(input_dir)
-                league_output_dir = output_dir / relative_path.parent
-            except ValueError:
-                # test.csv 등 input_dir 외부 파일 처리
-                league_output_dir = output_dir
+    # 모든 CSV 파일에서 재사용할 브라우저 풀 (드라이버는 처음 필요할 때 생성)
+    pool = DriverPool(args.workers, headless=not args.no_headless)
+    
+    def league_output_file(csv_file: Path) -> Path:
+        # 리그별 저장 경로 (입력 디렉토리 구조 유지)
+        try:
+            relative_path = csv_file.relative_to(input_dir)
+            league_output_dir = output_dir / relative_path.parent
+        except ValueError:
+            # test.csv 등 input_dir 외부 파일 처리
+            league_output_dir = output_dir
+        return league_output_dir / f"{csv_file.stem}_odds.csv"
+    
+    # 모든 CSV 파일의 URL을 하나의 작업 큐로 처리 (파일 경계에서 워커가 쉬지 않음)
+    # 결과 행은 메모리에 모으지 않고 리그별 CSV에 바로 기록
+    completed = process_csv_files(csv_files, handicaps, logger, pool, output_path=league_output_file)
+    
+    try:
+        for idx, (csv_file, _saved_rows, failed_urls) in enumerate(completed, 1):
+            logger.info(f"\n[{idx}/{len(csv_files)}] Completed: {csv_file}")
             
-            league_output_dir.mkdir(parents=True, exist_ok=True)
+            # 실패한 URL 추가
+            all_failed_urls.extend(failed_urls)
             
-            # 리그별 CSV 저장
-            output_file = league_output_dir / f"{csv_file.stem}_odds.csv"
-            save_results_to_csv(results, output_file, logger)
-        
-        # 실패한 URL 추가
-        all_failed_urls.extend(failed_urls)
-        
-        # 체크포인트 업데이트
-        checkpoint_data['processed_files'].append(str(csv_file))
-        checkpoint_data['failed_urls'] = all_failed_urls
+            # 체크포인트 업데이트 (완료 이벤트만 로그에 추가)
+            checkpoint_data['processed_files'].append(csv_file.as_posix())
+            checkpoint_data['failed_urls'] = all_failed_urls
+            append_checkpoint_event(checkpoint_file, {'done': csv_file.as_posix(), 'failed': failed_urls})
+    finally:
+        # 이벤트 로그를 스냅샷(checkpoint.json)으로 합침
         save_checkpoint(checkpoint_file, checkpoint_data)
+        # 남은 URL 작업을 먼저 정리한 뒤 브라우저 종료
+        completed.close()
+        pool.close()
     
     # 실패한 URL 저장
     failed_file = save_failed_urls(output_dir, all_failed_urls)
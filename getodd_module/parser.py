@@ -3,8 +3,16 @@ URL parsing functions for extracting league and season information
 """
 
 import re
+from functools import lru_cache
 from typing import Tuple
 
+# 정규표현식 패턴: (리그이름)-(YYYY-YYYY 또는 YYYY)
+# 예: jupiler-league-2020-2021 또는 allsvenskan-2020
+_LEAGUE_SEASON_RE = re.compile(r'^(.+?)-(\d{4}(?:-\d{4})?)$')
+
+# 슬러그의 하이픈 -> 공백 변환 테이블
+_HYPHEN_TR = str.maketrans('-', ' ')
+
 
 def parse_url_for_info(url: str) -> Tuple[str, str]:
     """
@@ -18,11 +26,21 @@ def parse_url_for_info(url: str) -> Tuple[str, str]:
         (리그 이름, 시즌 정보) 튜플
     """
     try:
+        # Fast path: URL 구조 .../football/country/league-season/match-teams/
+        # 리스트를 만들지 않고 '/' 위치만으로 league-season 부분을 잘라냄
+        i = url.find('/football/')
+        if i >= 0:
+            j = url.find('/', i + 10)  # country 끝
+            if j > 0:
+                k = url.find('/', j + 1)  # league-season 끝
+                league_season_slug = url[j + 1:k] if k > 0 else url[j + 1:]
+                if league_season_slug and '#' not in league_season_slug:
+                    return _parse_league_season_slug(league_season_slug)
+        
         # URL에서 불필요한 부분 제거
         clean_url = url.split('/#')[0].strip('/')
         parts = clean_url.split('/')
         
-        # URL 구조: .../football/country/league-season/match-teams/
         # football 다음의 league-season 부분 찾기
         league_season_slug = None
         
@@ -43,37 +61,49 @@ def parse_url_for_info(url: str) -> Tuple[str, str]:
             else:
                 return 'N/A', 'N/A'
         
-        # 정규표현식 패턴: (리그이름)-(YYYY-YYYY 또는 YYYY)
-        # 예: jupiler-league-2020-2021 또는 allsvenskan-2020
-        pattern = re.compile(r'^(.+?)-(\d{4}(?:-\d{4})?)$')
-        match = pattern.match(league_season_slug)
-        
-        if match:
-            # 그룹 1: 리그 이름 슬러그, 그룹 2: 시즌 정보
-            league_name_slug = match.group(1)
-            season_info = match.group(2)
-            
-            # 하이픈을 공백으로 바꾸고 첫 글자 대문자로
-            league_name = league_name_slug.replace('-', ' ').title()
-            
-            # 시즌 정보 정규화: YYYY -> YYYY-YYYY+1
-            if '-' not in season_info and len(season_info) == 4:
-                year = int(season_info)
-                season_info = f'{year}-{year + 1}'
-            # 이미 YYYY-YYYY 형식이면 그대로 유지
-            
-        else:
-            # 패턴에 맞지 않으면 시즌 정보 없이 전체를 리그 이름으로 처리
-            season_info = 'N/A'
-            league_name = league_season_slug.replace('-', ' ').title()
-            
-        return league_name, season_info
+        return _parse_league_season_slug(league_season_slug)
         
     except Exception:
         # URL 구조가 예상과 완전히 다른 경우에 대한 예외 처리
         return 'N/A', 'N/A'
 
 
+@lru_cache(maxsize=4096)
+def _parse_league_season_slug(league_season_slug: str) -> Tuple[str, str]:
+    """
+    'league-name-YYYY-YYYY' 슬러그를 (리그 이름, 시즌 정보)로 변환.
+    같은 CSV의 경기들은 슬러그가 모두 같으므로 결과를 캐시한다.
+    
+    Args:
+        league_season_slug: URL의 리그-시즌 부분
+        
+    Returns:
+        (리그 이름, 시즌 정보) 튜플
+    """
+    match = _LEAGUE_SEASON_RE.match(league_season_slug)
+    
+    if match:
+        # 그룹 1: 리그 이름 슬러그, 그룹 2: 시즌 정보
+        league_name_slug = match.group(1)
+        season_info = match.group(2)
+        
+        # 하이픈을 공백으로 바꾸고 첫 글자 대문자로
+        league_name = league_name_slug.translate(_HYPHEN_TR).title()
+        
+        # 시즌 정보 정규화: YYYY -> YYYY-YYYY+1
+        if '-' not in season_info and len(season_info) == 4:
+            year = int(season_info)
+            season_info = f'{year}-{year + 1}'
+        # 이미 YYYY-YYYY 형식이면 그대로 유지
+        
+    else:
+        # 패턴에 맞지 않으면 시즌 정보 없이 전체를 리그 이름으로 처리
+        season_info = 'N/A'
+        league_name = league_season_slug.translate(_HYPHEN_TR).title()
+        
+    return league_name, season_info
+
+
 def extract_match_id(url: str) -> str:
     """
     URL에서 매치 ID 추출
@@ -0,0 +1,208 @@
+"""
+WebDriver pool shared by all workers across CSV files
+"""
+
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from selenium import webdriver
+
+from .config import POOL_HEALTH_CHECK_IDLE
+from .scraper import create_driver, force_quit_driver, is_driver_alive
+
+
+class DriverPool:
+    """
+    재사용 가능한 WebDriver 풀
+
+    main()에서 한 번 생성하여 모든 CSV 파일 처리에 재사용한다.
+    드라이버는 처음 필요할 때 생성되며, 각 드라이버에는 로그용 worker_id가 부여된다.
+    """
+
+    def __init__(self, size: int, headless: bool = True):
+        """
+        Args:
+            size: 최대 드라이버 수 (병렬 워커 수)
+            headless: 헤드리스 모드 여부
+        """
+        self.size = max(1, size)
+        self.headless = headless
+        self._idle = queue.Queue()
+        self._drivers: List[webdriver.Chrome] = []
+        self._free_ids = list(range(self.size))
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def get(self, timeout: Optional[float] = None) -> webdriver.Chrome:
+        """
+        유휴 드라이버를 꺼내거나, 여유 슬롯이 있으면 새로 생성
+
+        오래 쉬고 있던 드라이버는 꺼낼 때 상태를 확인하고, 죽어 있으면 폐기 후 새로 만든다.
+
+        Args:
+            timeout: 모든 슬롯이 사용 중일 때 반납을 기다릴 최대 시간(초). None이면 무한 대기
+
+        Returns:
+            Chrome WebDriver 인스턴스
+
+        Raises:
+            TimeoutError: timeout 안에 사용할 수 있는 드라이버가 없을 때
+        """
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    worker_id = self._free_ids.pop(0) if self._free_ids else None
+                if worker_id is not None:
+                    return self._create(worker_id)
+                # 모든 슬롯이 사용 중이면 반납(또는 백그라운드 교체)될 때까지 대기
+                try:
+                    driver = self._idle.get(timeout=timeout)
+                except queue.Empty:
+                    raise TimeoutError(f"No driver available within {timeout} seconds")
+            if driver is None:
+                # 백그라운드 교체가 실패하여 슬롯이 비었다는 신호 -> 다시 시도
+                continue
+            if self._is_healthy(driver):
+                return driver
+            self.discard(driver, replace=False)
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = None) -> Iterator[webdriver.Chrome]:
+        """
+        with 문으로 드라이버를 빌리고 자동 반납
+
+        블록에서 예외가 나면 드라이버 상태를 확인하여 살아 있으면 반납, 죽었으면 폐기한다.
+
+        Args:
+            timeout: get()과 동일
+
+        Yields:
+            Chrome WebDriver 인스턴스
+        """
+        driver = self.get(timeout)
+        try:
+            yield driver
+        except BaseException:
+            if is_driver_alive(driver):
+                self.put(driver)
+            else:
+                self.discard(driver)
+            raise
+        self.put(driver)
+
+    def _is_healthy(self, driver: webdriver.Chrome) -> bool:
+        """
+        유휴 드라이버 상태 확인 (최근에 사용된 드라이버는 확인 생략)
+
+        Args:
+            driver: 확인할 WebDriver 인스턴스
+
+        Returns:
+            사용 가능 여부
+        """
+        idle_since = getattr(driver, 'idle_since', None)
+        if idle_since is not None and time.monotonic() - idle_since < POOL_HEALTH_CHECK_IDLE:
+            return True
+        return is_driver_alive(driver)
+
+    def _create(self, worker_id: int) -> webdriver.Chrome:
+        """
+        슬롯 번호로 새 드라이버 생성 (실패하면 슬롯 반환 후 예외 전달)
+
+        Args:
+            worker_id: 슬롯 번호
+
+        Returns:
+            Chrome WebDriver 인스턴스
+        """
+        try:
+            driver = create_driver(self.headless, worker_id=worker_id)
+        except Exception:
+            with self._lock:
+                self._free_ids.append(worker_id)
+            raise
+
+        driver.worker_id = worker_id
+        with self._lock:
+            self._drivers.append(driver)
+        return driver
+
+    def _replace(self, worker_id: int):
+        """
+        폐기된 드라이버의 슬롯에 새 드라이버를 미리 띄워 유휴 큐에 넣음
+        (백그라운드 스레드에서 실행되어 Chrome 시작 시간이 재시도 대기와 겹침)
+
+        Args:
+            worker_id: 슬롯 번호
+        """
+        try:
+            driver = self._create(worker_id)
+        except Exception:
+            # 슬롯은 _create()에서 반환됨; 대기 중인 get()을 깨워 직접 생성하게 함
+            self._idle.put(None)
+            return
+        with self._lock:
+            closed = self._closed
+            if closed and driver in self._drivers:
+                self._drivers.remove(driver)
+        if closed:
+            # 생성 중에 풀이 닫힌 경우
+            force_quit_driver(driver, system_cleanup=False)
+        else:
+            self.put(driver)
+
+    def put(self, driver: webdriver.Chrome):
+        """
+        사용이 끝난 드라이버 반납
+
+        Args:
+            driver: 반납할 WebDriver 인스턴스
+        """
+        driver.idle_since = time.monotonic()
+        self._idle.put(driver)
+
+    def discard(self, driver: webdriver.Chrome, replace: bool = True):
+        """
+        고장난 드라이버를 종료하고 슬롯을 비움
+
+        Args:
+            driver: 폐기할 WebDriver 인스턴스
+            replace: True이면 같은 슬롯의 새 드라이버를 백그라운드에서 바로 생성
+        """
+        worker_id = getattr(driver, 'worker_id', 0)
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+            replace = replace and not self._closed
+            if not replace:
+                self._free_ids.append(worker_id)
+        # 다른 워커의 브라우저까지 죽이지 않도록 시스템 전체 정리는 생략
+        force_quit_driver(driver, system_cleanup=False)
+        if replace:
+            threading.Thread(target=self._replace, args=(worker_id,), daemon=True).start()
+
+    def close(self):
+        """모든 드라이버 종료"""
+        with self._lock:
+            self._closed = True
+            drivers = list(self._drivers)
+            self._drivers.clear()
+            self._free_ids = list(range(self.size))
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+        for driver in drivers:
+            force_quit_driver(driver, system_cleanup=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -2,253 +2,423 @@
 Processing logic for CSV files and parallel execution
 """
 
+import csv
+import io
+import os
+import random
+import re
+import shutil
+import threading
 import time
-import pandas as pd
+from collections import deque
 from pathlib import Path
-from typing import List, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Tuple, Dict, Optional, Iterator, Union
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
-from .config import CSV_COLUMNS, CSV_ENCODING, WAIT_DELAY
-from .scraper import create_driver, scrape_match_and_odds_with_driver, scrape_match_and_odds, cleanup_chromedriver_processes, is_driver_alive, force_quit_driver
+from .config import (
+    CSV_COLUMNS, CSV_ENCODING, WAIT_DELAY, PROGRESS_LOG_EVERY, PROGRESS_LOG_INTERVAL,
+    RETRY_BACKOFF_BASE, RETRY_BACKOFF_CAP, MAX_PENDING_PER_WORKER
+)
+from .scraper import scrape_match_and_odds_with_driver, reset_browser_context
+from .pool import DriverPool
+
+__all__ = [
+    'process_url',
+    'process_url_batch',
+    'process_csv_files',
+    'process_csv_file',
+    'save_results_to_csv',
+    'merge_partial_results',
+]
+
+# 오류 메시지 분류 패턴 (각 단계마다 메시지를 한 번만 스캔; (?i:...)는 대소문자 무시)
+# 브라우저 프로세스가 죽은 경우 (재시작 필요)
+_RESTART_RE = re.compile(
+    r"HTTPConnectionPool"  # Connection pool errors
+    r"|Max retries exceeded"  # Connection timeout
+    r"|(?i:chrome not reachable|session not created|chromedriver"
+    r"|can not connect to the service|unexpectedly exited|status code was: -9)"
+)
+# 브라우저는 살아 있고 탭/렌더러만 망가진 경우 (새 탭으로 초기화)
+_RESET_RE = re.compile(r"(?i:target window already closed|no such window|disconnected)")
+# 그 밖에 원인을 알 수 없는 WebDriver 오류 (재시작)
+_GENERIC_RE = re.compile(
+    r"Stacktrace"
+    r"|Message: \n"  # Empty message with stacktrace
+    r"|(?i:message: unknown error)"
+)
+
+_RESTART = 'restart'
+_RESET = 'reset'
+_ERROR_KIND_LABELS = {
+    _RESTART: 'Critical - Browser restart needed',
+    _RESET: 'Session - Tab reset',
+    None: 'Regular',
+}
+
+
+def _classify_error(error_msg: str) -> Optional[str]:
+    """
+    오류 복구 방법 판별
+    
+    Args:
+        error_msg: 예외 메시지
+        
+    Returns:
+        _RESTART (브라우저 재시작), _RESET (탭 초기화) 또는 None (일반 재시도)
+    """
+    if _RESTART_RE.search(error_msg):
+        return _RESTART
+    if "localhost" in error_msg and "session" in error_msg:  # Session connection lost
+        return _RESTART
+    if _RESET_RE.search(error_msg):
+        return _RESET
+    if _GENERIC_RE.search(error_msg):
+        return _RESTART
+    return None
+
+
+class _ProgressLog:
+    """
+    URL 처리 진행 상황을 PROGRESS_LOG_EVERY개 또는 PROGRESS_LOG_INTERVAL초마다
+    한 줄로 요약하여 INFO 로그에 기록 (URL별 상세 로그는 DEBUG)
+    """
+
+    def __init__(self, logger: logging.Logger, total: int):
+        """
+        Args:
+            logger: Logger 인스턴스
+            total: 전체 URL 수
+        """
+        self.logger = logger
+        self.total = total
+        self.ok = 0
+        self.failed = 0
+        self._last_log = time.monotonic()
+        self._lock = threading.Lock()
+
+    def tick(self, ok: bool):
+        """
+        URL 하나 완료 기록
+
+        Args:
+            ok: 성공 여부
+        """
+        with self._lock:
+            if ok:
+                self.ok += 1
+            else:
+                self.failed += 1
+            done = self.ok + self.failed
+            now = time.monotonic()
+            if (done % PROGRESS_LOG_EVERY and done != self.total
+                    and now - self._last_log < PROGRESS_LOG_INTERVAL):
+                return
+            self._last_log = now
+            ok_count, failed_count = self.ok, self.failed
+        self.logger.info(f"Progress: {done}/{self.total} URLs ({ok_count} ok, {failed_count} failed)")
+
+    def on_done(self, future):
+        """Future 완료 콜백 (취소된 작업은 세지 않음)"""
+        if future.cancelled():
+            return
+        self.tick(future.exception() is None and future.result()[1] is None)
+
+
+def process_url(url: str, pool: DriverPool, handicaps: List[str],
+                logger: logging.Logger, position: str = '') -> Tuple[List, Optional[Dict]]:
+    """
+    Worker task: 풀에서 브라우저를 빌려 단일 URL 처리 (재시도 포함)
+    
+    Args:
+        url: 처리할 URL
+        pool: DriverPool 인스턴스
+        handicaps: 핸디캡 리스트
+        logger: Logger 인스턴스
+        position: 로그용 진행 위치 (예: "[3/120]")
+        
+    Returns:
+        (결과 리스트, 실패 정보 딕셔너리 또는 None) 튜플
+    """
+    driver = pool.get()
+    worker_id = getattr(driver, 'worker_id', 0)
+    retry_count = 0
+    max_retries = 3
+    wait_time = RETRY_BACKOFF_BASE
+    
+    try:
+        while retry_count < max_retries:
+            try:
+                logger.debug("  Worker %s %s: %s", worker_id, position, url)
+                if retry_count > 0:
+                    logger.info(f"    Retry attempt {retry_count}/{max_retries}")
+                
+                # 사전 상태 확인(is_driver_alive)은 하지 않음: 죽은 드라이버는 첫 명령에서 바로 예외가 나고
+                # _classify_error()가 재시작으로 분류함 (오래 쉰 드라이버는 DriverPool.get()에서 확인)
+                started = time.monotonic()
+                result = scrape_match_and_odds_with_driver(driver, url, handicaps)
+                logger.info(f"    ✓ Worker {worker_id}: Collected {len(result)} entries")
+                # 요청 간 최소 간격(WAIT_DELAY)만 보장: 스크래핑이 이미 그만큼 걸렸으면 대기하지 않음
+                remaining = WAIT_DELAY - (time.monotonic() - started)
+                if remaining > 0:
+                    time.sleep(remaining)
+                return result, None
+                
+            except Exception as e:
+                retry_count += 1
+                error_msg = str(e)
+                
+                # 브라우저 재시작 / 탭 초기화 / 일반 재시도 판별
+                error_kind = _classify_error(error_msg)
+                
+                if retry_count >= max_retries:
+                    logger.error(f"    ✗ Worker {worker_id}: Failed after {max_retries} attempts")
+                    logger.error(f"      Final error: {error_msg[:300]}")
+                    if error_kind == _RESTART:
+                        # 죽은 드라이버를 반납하면 다음 URL이 확인 없이 받아 첫 시도를 잃으므로 폐기
+                        pool.discard(driver)
+                        driver = None
+                    return [], {
+                        'url': url, 
+                        'error': error_msg[:500], 
+                        'worker_id': worker_id,
+                        'attempts': retry_count
+                    }
+                
+                logger.warning(f"    ⚠ Worker {worker_id}: Attempt {retry_count}/{max_retries} failed")
+                logger.warning(f"      Error type: {_ERROR_KIND_LABELS[error_kind]}")
+                logger.debug(f"      Error details: {error_msg[:200]}")
+                
+                # Restart browser for critical errors (or every 2nd retry)
+                restart = error_kind == _RESTART or retry_count == 2
+                if not restart and error_kind == _RESET:
+                    # 브라우저 프로세스는 유지하고 새 탭으로 교체 (실패하면 재시작)
+                    logger.info(f"    Worker {worker_id}: Resetting browser tab...")
+                    restart = not reset_browser_context(driver)
+                if restart:
+                    # 먼저 폐기하여 새 브라우저가 백오프 대기 동안 백그라운드에서 뜨도록 함
+                    logger.info(f"    Worker {worker_id}: Restarting browser...")
+                    pool.discard(driver)
+                    driver = None
+                
+                # Decorrelated jitter backoff: 워커들이 같은 시점에 몰려서 재시도하지 않도록 분산
+                wait_time = min(RETRY_BACKOFF_CAP, random.uniform(RETRY_BACKOFF_BASE, wait_time * 3))
+                logger.info(f"      Waiting {wait_time:.1f} seconds before retry...")
+                time.sleep(wait_time)
+                
+                if restart:
+                    try:
+                        driver = pool.get()
+                        logger.info(f"    Worker {worker_id}: Browser restarted successfully")
+                    except Exception as restart_error:
+                        logger.error(f"    Worker {worker_id}: Failed to restart browser: {restart_error}")
+                        # Wait longer and try one more time
+                        time.sleep(5)
+                        try:
+                            driver = pool.get()
+                            logger.info(f"    Worker {worker_id}: Browser recovered after extended wait")
+                        except Exception as final_error:
+                            logger.error(f"    Worker {worker_id}: Final recovery attempt failed: {final_error}")
+                            return [], {
+                                'url': url, 
+                                'error': f"Browser restart failed: {final_error}", 
+                                'worker_id': worker_id,
+                                'attempts': retry_count
+                            }
+                    worker_id = getattr(driver, 'worker_id', worker_id)
+    finally:
+        if driver is not None:
+            pool.put(driver)
 
 
 def process_url_batch(urls_batch: List[str], worker_id: int, handicaps: List[str], 
-                      logger: logging.Logger, headless: bool = True) -> Tuple[List, List]:
+                      logger: logging.Logger, headless: bool = True,
+                      pool: Optional[DriverPool] = None) -> Tuple[List, List]:
     """
-    Worker function to process a batch of URLs in a single browser instance
+    Worker function to process a batch of URLs sequentially
     
     Args:
         urls_batch: URL 리스트
         worker_id: 워커 ID
         handicaps: 핸디캡 리스트
         logger: Logger 인스턴스
-        headless: 헤드리스 모드 여부
+        headless: 헤드리스 모드 여부 (pool이 없을 때만 사용)
+        pool: 공유 DriverPool (없으면 브라우저 1개짜리 풀을 임시로 생성)
         
     Returns:
         (결과 리스트, 실패한 URL 리스트) 튜플
     """
     results = []
     failed_urls = []
-    driver = None
-    
-    # Clean up before starting (only for first worker)
-    if worker_id == 0:
-        cleanup_chromedriver_processes()
-        time.sleep(1)
+    own_pool = pool is None
+    if own_pool:
+        pool = DriverPool(1, headless)
     
     try:
-        driver = create_driver(headless)
         logger.info(f"Worker {worker_id}: Processing {len(urls_batch)} URLs")
-        
-        for idx, url in enumerate(urls_batch):
-            retry_count = 0
-            max_retries = 3
-            success = False
-            
-            while retry_count < max_retries and not success:
-                try:
-                    logger.info(f"  Worker {worker_id} [{idx+1}/{len(urls_batch)}]: {url}")
-                    if retry_count > 0:
-                        logger.info(f"    Retry attempt {retry_count}/{max_retries}")
-                    
-                    # Check driver health before scraping
-                    if not is_driver_alive(driver):
-                        raise Exception("Driver connection lost - needs restart")
-                    
-                    result = scrape_match_and_odds_with_driver(driver, url, handicaps)
-                    results.extend(result)
-                    logger.info(f"    ✓ Worker {worker_id}: Collected {len(result)} entries")
-                    success = True
-                    time.sleep(WAIT_DELAY)  # Small delay between requests
-                    
-                except Exception as e:
-                    retry_count += 1
-                    error_msg = str(e)
-                    
-                    # Check for critical errors that need browser restart
-                    critical_error = any([
-                        "Stacktrace" in error_msg,
-                        "chrome not reachable" in error_msg.lower(),
-                        "session not created" in error_msg.lower(),
-                        "target window already closed" in error_msg.lower(),
-                        "disconnected" in error_msg.lower(),
-                        "Message: \n" in error_msg,  # Empty message with stacktrace
-                        "Message: unknown error" in error_msg.lower(),
-                        "chromedriver" in error_msg.lower(),
-                        "can not connect to the service" in error_msg.lower(),
-                        "unexpectedly exited" in error_msg.lower(),
-                        "status code was: -9" in error_msg.lower(),
-                        "HTTPConnectionPool" in error_msg,  # Connection pool errors
-                        "Max retries exceeded" in error_msg,  # Connection timeout
-                        "localhost" in error_msg and "session" in error_msg,  # Session connection lost
-                        "Driver connection lost" in error_msg  # Our custom check
-                    ])
-                    
-                    if retry_count < max_retries:
-                        logger.warning(f"    ⚠ Worker {worker_id}: Attempt {retry_count}/{max_retries} failed")
-                        logger.warning(f"      Error type: {'Critical - Browser restart needed' if critical_error else 'Regular'}")
-                        logger.debug(f"      Error details: {error_msg[:200]}")
-                        
-                        # Exponential backoff
-                        wait_time = 2 ** retry_count
-                        logger.info(f"      Waiting {wait_time} seconds before retry...")
-                        time.sleep(wait_time)
-                        
-                        # Restart browser for critical errors (or every 2nd retry)
-                        if critical_error or retry_count == 2:
-                            try:
-                                logger.info(f"    Worker {worker_id}: Restarting browser...")
-                                
-                                # Use force quit for better cleanup
-                                force_quit_driver(driver)
-                                driver = None  # Clear reference
-                                time.sleep(2)
-                                
-                                # Create new driver
-                                driver = create_driver(headless)
-                                logger.info(f"    Worker {worker_id}: Browser restarted successfully")
-                            except Exception as restart_error:
-                                logger.error(f"    Worker {worker_id}: Failed to restart browser: {restart_error}")
-                                # Wait longer and try one more time
-                                cleanup_chromedriver_processes()
-                                time.sleep(5)
-                                try:
-                                    driver = create_driver(headless)
-                                    logger.info(f"    Worker {worker_id}: Browser recovered after extended wait")
-                                except Exception as final_error:
-                                    logger.error(f"    Worker {worker_id}: Final recovery attempt failed: {final_error}")
-                                    # Don't raise, continue with failed URLs
-                                    failed_urls.append({
-                                        'url': url, 
-                                        'error': f"Browser restart failed: {final_error}", 
-                                        'worker_id': worker_id,
-                                        'attempts': retry_count
-                                    })
-                                    break  # Exit retry loop for this URL
-                    else:
-                        logger.error(f"    ✗ Worker {worker_id}: Failed after {max_retries} attempts")
-                        logger.error(f"      Final error: {error_msg[:300]}")
-                        failed_urls.append({
-                            'url': url, 
-                            'error': error_msg[:500], 
-                            'worker_id': worker_id,
-                            'attempts': retry_count
-                        })
+        for idx, url in enumerate(urls_batch, 1):
+            result, failed = process_url(url, pool, handicaps, logger, f"[{idx}/{len(urls_batch)}]")
+            results.extend(result)
+            if failed:
+                failed_urls.append(failed)
     finally:
-        if driver:
+        if own_pool:
             logger.info(f"Worker {worker_id}: Closing browser...")
-            force_quit_driver(driver)
+            pool.close()
             logger.info(f"Worker {worker_id}: Browser closed")
     
     return results, failed_urls
 
 
-def process_csv_file(csv_file: Path, handicaps: List[str], output_dir: Path, 
-                     logger: logging.Logger, headless: bool = True, 
-                     num_workers: int = 1) -> Tuple[List, List]:
+def process_csv_files(csv_files: List[Path], handicaps: List[str], logger: logging.Logger,
+                      pool: DriverPool,
+                      output_path: Optional[Callable[[Path], Path]] = None
+                      ) -> Iterator[Tuple[Path, Union[List, int], List]]:
     """
-    단일 CSV 파일 처리 (병렬 처리 지원)
+    여러 CSV 파일의 URL을 하나의 작업 큐로 처리
+    
+    모든 파일의 URL을 하나의 작업 순서로 스레드 풀에 제출하므로, 한 파일의 마지막 URL들을
+    처리하는 동안에도 나머지 워커는 다음 파일의 URL을 계속 처리한다.
+    결과를 기다리는 작업은 드라이버당 MAX_PENDING_PER_WORKER개로 제한하여
+    메모리에 쌓이는 결과가 전체 URL 수에 비례하지 않게 한다.
+    결과는 파일 순서대로, 각 파일의 모든 URL이 끝나는 즉시 반환된다.
+    읽을 수 없거나 match_url 컬럼이 없는 파일은 오류를 기록하고 반환하지 않는다.
+    
+    output_path가 주어지면 결과 행을 모아두지 않고 URL 순서대로 바로 출력 CSV에 기록한다
+    (결과가 없는 파일은 출력 파일을 만들지 않음).
     
     Args:
-        csv_file: CSV 파일 경로
+        csv_files: CSV 파일 경로 리스트
         handicaps: 핸디캡 리스트
-        output_dir: 출력 디렉토리
         logger: Logger 인스턴스
-        headless: 헤드리스 모드 여부
-        num_workers: 병렬 워커 수
+        pool: 공유 DriverPool
+        output_path: 입력 CSV 경로 -> 출력 CSV 경로 함수 (optional)
         
-    Returns:
-        (전체 결과 리스트, 실패한 URL 리스트) 튜플
+    Yields:
+        (CSV 파일 경로, 결과 리스트 또는 기록한 행 수(output_path 사용 시), 실패한 URL 리스트) 튜플
     """
-    all_results = []
-    failed_urls = []
+    # 진행 로그의 전체 URL 수가 고정되도록 작업을 제출하기 전에 모든 파일의 URL을 먼저 읽음
+    file_urls = []
+    for csv_file in csv_files:
+        try:
+            # match_url 컬럼만 필요하므로 DataFrame 없이 한 줄씩 읽기
+            with open(csv_file, 'r', newline='', encoding=CSV_ENCODING) as f:
+                reader = csv.DictReader(f)
+                if 'match_url' not in (reader.fieldnames or []):
+                    raise KeyError('match_url')
+                urls = [row['match_url'] for row in reader if row['match_url']]
+        except Exception as e:
+            # 완료로 반환하지 않음 (체크포인트에 기록되지 않아 --resume 시 다시 시도)
+            logger.error(f"Failed to process CSV file {csv_file}: {str(e)}")
+            continue
+        file_urls.append((csv_file, urls))
     
+    executor = ThreadPoolExecutor(max_workers=pool.size)
     try:
-        df = pd.read_csv(csv_file)
-        urls = df['match_url'].tolist()
-        total_urls = len(urls)
-        logger.info(f"Processing {csv_file.name}: {total_urls} URLs found with {num_workers} workers")
+        progress = _ProgressLog(logger, sum(len(urls) for _, urls in file_urls))
+        # 제출 순서(= 결과를 꺼내는 순서)로 모든 파일의 URL 작업을 나열
+        jobs = (
+            (url, f"[{idx}/{len(urls)}]")
+            for _, urls in file_urls
+            for idx, url in enumerate(urls, 1)
+        )
+        # 결과를 기다리는 작업 수를 제한: 앞쪽의 느린 URL 때문에 뒤쪽 파일의 결과가 메모리에 쌓이지 않음
+        max_pending = MAX_PENDING_PER_WORKER * pool.size
+        pending = deque()
         
-        if num_workers == 1:
-            # Sequential processing with retry logic
-            for idx, url in enumerate(urls):
-                retry_count = 0
-                max_retries = 3
-                success = False
-                
-                while retry_count < max_retries and not success:
-                    try:
-                        logger.info(f"  [{idx+1}/{total_urls}] Processing: {url}")
-                        if retry_count > 0:
-                            logger.info(f"    Retry attempt {retry_count}/{max_retries}")
-                        
-                        results = scrape_match_and_odds(url, handicaps, headless)
-                        all_results.extend(results)
-                        logger.info(f"    ✓ Collected {len(results)} odds entries")
-                        success = True
-                        
-                    except Exception as e:
-                        retry_count += 1
-                        error_msg = str(e)
-                        
-                        # Check for critical errors
-                        critical_error = any([
-                            "Stacktrace" in error_msg,
-                            "chrome not reachable" in error_msg.lower(),
-                            "session not created" in error_msg.lower(),
-                            "Message: \n" in error_msg,
-                            "chromedriver" in error_msg.lower(),
-                            "can not connect to the service" in error_msg.lower(),
-                            "unexpectedly exited" in error_msg.lower()
-                        ])
-                        
-                        if retry_count < max_retries:
-                            logger.warning(f"    ⚠ Attempt {retry_count}/{max_retries} failed")
-                            logger.warning(f"      Error type: {'Critical' if critical_error else 'Regular'}")
-                            wait_time = 2 ** retry_count  # Exponential backoff
-                            logger.info(f"      Waiting {wait_time} seconds before retry...")
-                            time.sleep(wait_time)
-                        else:
-                            logger.error(f"    ✗ Failed after {max_retries} attempts")
-                            logger.error(f"      Final error: {error_msg[:300]}")
-                            failed_urls.append({
-                                'url': url, 
-                                'error': error_msg[:500], 
-                                'csv_file': str(csv_file),
-                                'attempts': retry_count
-                            })
-                    
-                    if success:
-                        time.sleep(1)  # Delay between successful requests
-        else:
-            # Parallel processing
-            batch_size = (total_urls + num_workers - 1) // num_workers
-            url_batches = [urls[i:i+batch_size] for i in range(0, total_urls, batch_size)]
+        def refill():
+            while len(pending) < max_pending:
+                job = next(jobs, None)
+                if job is None:
+                    return
+                future = executor.submit(process_url, job[0], pool, handicaps, logger, job[1])
+                future.add_done_callback(progress.on_done)
+                pending.append(future)
+        
+        for csv_file, urls in file_urls:
+            logger.info(f"Processing {csv_file.name}: {len(urls)} URLs found with {pool.size} workers")
+            all_results = []
+            failed_urls = []
+            output_file = None
+            out = None
+            writer = None
+            row_count = 0
             
-            with ThreadPoolExecutor(max_workers=num_workers) as executor:
-                futures = {}
-                
-                for worker_id, batch in enumerate(url_batches):
-                    if batch:  # Only submit if batch is not empty
-                        future = executor.submit(process_url_batch, batch, worker_id, 
-                                                handicaps, logger, headless)
-                        futures[future] = worker_id
-                
-                for future in as_completed(futures):
-                    worker_id = futures[future]
+            try:
+                # 제출 순서대로 결과 수집 (출력 행 순서 유지)
+                for url in urls:
+                    refill()
+                    future = pending.popleft()
                     try:
                         results, failed = future.result()
-                        all_results.extend(results)
-                        failed_urls.extend(failed)
-                        logger.info(f"Worker {worker_id} completed: {len(results)} entries collected")
                     except Exception as e:
-                        logger.error(f"Worker {worker_id} failed: {str(e)}")
+                        logger.error(f"Task for {url} failed: {str(e)}")
+                        results, failed = [], {'url': url, 'error': str(e)[:500]}
+                    
+                    if output_path is None:
+                        all_results.extend(results)
+                    elif results:
+                        if writer is None:
+                            output_file = output_path(csv_file)
+                            output_file.parent.mkdir(parents=True, exist_ok=True)
+                            out = open(output_file, 'w', newline='', encoding=CSV_ENCODING)
+                            writer = csv.writer(out, lineterminator=os.linesep)
+                            writer.writerow(CSV_COLUMNS)
+                        writer.writerows(results)
+                        row_count += len(results)
+                    if failed:
+                        failed['csv_file'] = str(csv_file)
+                        failed_urls.append(failed)
+            finally:
+                if out is not None:
+                    out.close()
             
-    except Exception as e:
-        logger.error(f"Failed to process CSV file {csv_file}: {str(e)}")
+            if output_path is None:
+                yield csv_file, all_results, failed_urls
+            else:
+                if output_file is not None:
+                    logger.info(f"  Saved {row_count} entries to {output_file}")
+                yield csv_file, row_count, failed_urls
+    finally:
+        # 중간에 중단되면 아직 시작하지 않은 URL 작업은 취소
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def process_csv_file(csv_file: Path, handicaps: List[str], output_dir: Path, 
+                     logger: logging.Logger, headless: bool = True, 
+                     num_workers: int = 1, pool: Optional[DriverPool] = None) -> Tuple[List, List]:
+    """
+    단일 CSV 파일 처리 (병렬 처리 지원)
+    
+    URL 단위 작업을 스레드 풀에 제출하므로 느린 URL이 있어도 다른 워커가 쉬지 않는다.
+    
+    Args:
+        csv_file: CSV 파일 경로
+        handicaps: 핸디캡 리스트
+        output_dir: 출력 디렉토리
+        logger: Logger 인스턴스
+        headless: 헤드리스 모드 여부 (pool이 없을 때만 사용)
+        num_workers: 병렬 워커 수 (pool이 없을 때만 사용)
+        pool: 여러 CSV 파일에 걸쳐 재사용할 DriverPool
         
-    return all_results, failed_urls
+    Returns:
+        (전체 결과 리스트, 실패한 URL 리스트) 튜플
+    """
+    own_pool = pool is None
+    if own_pool:
+        pool = DriverPool(num_workers, headless)
+    
+    try:
+        results = list(process_csv_files([csv_file], handicaps, logger, pool))
+        if not results:
+            # 파일을 읽지 못함 (오류는 process_csv_files()에서 기록)
+            return [], []
+        _, all_results, failed_urls = results[0]
+        return all_results, failed_urls
+    finally:
+        if own_pool:
+            pool.close()
 
 
 def save_results_to_csv(results: List, output_file: Path, logger: logging.Logger = None):
@@ -261,12 +431,41 @@ def save_results_to_csv(results: List, output_file: Path, logger: logging.Logger
         logger: Logger 인스턴스 (optional)
     """
     if results:
-        df = pd.DataFrame(results, columns=CSV_COLUMNS)
-        df.to_csv(output_file, index=False, encoding=CSV_ENCODING)
+        # 문자열 행을 그대로 기록 (DataFrame 변환 없이)
+        with open(output_file, 'w', newline='', encoding=CSV_ENCODING) as f:
+            writer = csv.writer(f, lineterminator=os.linesep)
+            writer.writerow(CSV_COLUMNS)
+            writer.writerows(results)
         if logger:
             logger.info(f"  Saved {len(results)} entries to {output_file}")
 
 
+def _strip_bom(line: bytes) -> bytes:
+    """UTF-8 BOM 제거"""
+    return line[3:] if line.startswith(b'\xef\xbb\xbf') else line
+
+
+def _append_rows_by_header(partial_path: Path, final_header: bytes, dst):
+    """
+    헤더가 다른 부분 파일의 행을 최종 파일의 컬럼 순서로 바꿔 스트리밍 추가
+    (최종 파일에 없는 컬럼은 버리고, 부분 파일에 없는 컬럼은 빈 값)
+    
+    Args:
+        partial_path: 부분 파일 경로
+        final_header: 최종 파일의 헤더 줄 (bytes)
+        dst: 끝 위치에 열려 있는 최종 파일 (binary)
+    """
+    fieldnames = next(csv.reader([_strip_bom(final_header).decode('utf-8')]))
+    out = io.TextIOWrapper(dst, encoding='utf-8', newline='', write_through=True)
+    try:
+        writer = csv.DictWriter(out, fieldnames, extrasaction='ignore', lineterminator=os.linesep)
+        with open(partial_path, 'r', newline='', encoding=CSV_ENCODING) as f:
+            writer.writerows(csv.DictReader(f))
+    finally:
+        # dst는 호출한 쪽에서 닫으므로 래퍼만 분리
+        out.detach()
+
+
 def merge_partial_results(output_dir: Path, partial_file: str, final_file: str, 
                          logger: logging.Logger = None):
     """
@@ -282,15 +481,28 @@ def merge_partial_results(output_dir: Path, partial_file: str, final_file: str,
     final_path = output_dir / final_file
     
     if partial_path.exists():
-        df_partial = pd.read_csv(partial_path)
+        final_header = b''
         if final_path.exists():
-            df_final = pd.read_csv(final_path)
-            df_combined = pd.concat([df_final, df_partial], ignore_index=True)
+            with open(final_path, 'rb') as f:
+                final_header = f.readline()
+        if _strip_bom(final_header).strip():
+            # 최종 파일은 다시 읽지 않고 부분 파일의 데이터 행(헤더 제외)만 이어 붙임
+            with open(partial_path, 'rb') as src, open(final_path, 'rb+') as dst:
+                partial_header = src.readline()
+                dst.seek(0, os.SEEK_END)
+                if dst.tell() > 0:
+                    dst.seek(-1, os.SEEK_END)
+                    if dst.read(1) != b'\n':
+                        dst.write(os.linesep.encode())
+                if _strip_bom(partial_header).rstrip(b'\r\n') == _strip_bom(final_header).rstrip(b'\r\n'):
+                    shutil.copyfileobj(src, dst, length=1 << 20)
+                else:
+                    # 컬럼 구성/순서가 다르면 최종 파일의 컬럼 순서에 맞춰 한 행씩 변환
+                    _append_rows_by_header(partial_path, final_header, dst)
+            partial_path.unlink()  # 부분 파일 삭제
         else:
-            df_combined = df_partial
-            
-        df_combined.to_csv(final_path, index=False, encoding=CSV_ENCODING)
-        partial_path.unlink()  # 부분 파일 삭제
+            # 최종 파일이 없거나 헤더가 없으면(생성 직후 종료된 빈 파일 등) 부분 파일로 교체
+            partial_path.replace(final_path)
         
         if logger:
             logger.info(f"Merged partial results into {final_path}")
\ No newline at end of file
@@ -4,25 +4,166 @@ Core scraping functionality for odds data collection
 
 import time
 from datetime import datetime
+from functools import lru_cache
 from typing import List
-import pytz
+from zoneinfo import ZoneInfo
 import os
 import shutil
 import subprocess
 import platform
+import tempfile
+import threading
+from pathlib import Path
+import urllib3
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from selenium.common.exceptions import JavascriptException, TimeoutException, WebDriverException
 
 from .config import (
-    BROWSER_USER_AGENT, BROWSER_TIMEOUT, WAIT_DELAY, SCROLL_PAUSE, EXPAND_PAUSE,
+    BROWSER_USER_AGENT, BROWSER_TIMEOUT, PAGE_LOAD_TIMEOUT, OPTIONAL_ELEMENT_TIMEOUT, WAIT_POLL_FREQUENCY,
+    BLOCKED_URL_PATTERNS, CHROME_PROFILE_PREFIX, CHROME_DISK_CACHE_SIZE, CHROMEDRIVER_POOL_MAXSIZE,
+    CHROME_PROFILE_TMPFS, CHROME_PROFILE_TMPFS_MIN_FREE,
+    CONSENT_COOKIE_NAME,
     KOREA_TZ, UTC_FORMAT, DATE_PARSE_FORMAT, XPATH_SELECTORS
 )
 from .parser import parse_url_for_info
 
+try:
+    import psutil  # optional: 드라이버별 프로세스 트리 종료
+except ImportError:
+    psutil = None
+
+try:
+    import fcntl  # 프로필 디렉토리 잠금 (Windows에는 없음)
+except ImportError:
+    fcntl = None
+
+# create_driver()가 매번 경로 탐색/ChromeDriverManager 설치 확인을 하지 않도록 캐시
+_CHROMEDRIVER_PATH = None
+_CHROMEDRIVER_LOCK = threading.Lock()
+# 임시 프로필 상위 디렉토리 (_tmp_profile_root()가 처음 호출될 때 결정)
+_TMP_PROFILE_ROOT = None
+
+# 경기 시간 변환용 타임존 (매 경기마다 다시 만들지 않도록 모듈 로드 시 한 번 생성)
+_KOREA_TZ = ZoneInfo(KOREA_TZ)
+_UTC = ZoneInfo('UTC')
+# 배당이 없는 셀의 텍스트 (해당 Over/Under 행은 저장하지 않음)
+_MISSING_ODDS = frozenset(('N/A', '-'))
+# DATE_PARSE_FORMAT의 %b (영문 월 약어) 대응표; strptime의 로케일 확인/전역 락을 피하기 위함
+_MONTHS = {name: idx for idx, name in enumerate(
+    ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'), 1)}
+
+# 확장된 핸디캡 행의 북메이커 이름과 Over/Under 배당을 브라우저 안에서 한 번에 읽는 스크립트
+# arguments: [bookmaker_rows XPath, bookmaker_name 상대 XPath, odds_text 상대 XPath]
+# 반환값: [[bookmaker, over, under], ...] (북메이커 이름이 없는 행은 건너뜀)
+_EXTRACT_BOOKMAKER_ROWS_JS = """
+const rows = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const out = [];
+for (let i = 0; i < rows.snapshotLength; i++) {
+    const row = rows.snapshotItem(i);
+    const name = document.evaluate(arguments[1], row, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    if (!name) continue;
+    const odds = document.evaluate(arguments[2], row, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    out.push([
+        name.innerText.trim(),
+        odds.snapshotLength > 0 ? odds.snapshotItem(0).innerText.trim() : 'N/A',
+        odds.snapshotLength > 1 ? odds.snapshotItem(1).innerText.trim() : 'N/A'
+    ]);
+}
+return out;
+"""
+
+# 모든 핸디캡 행을 한 번의 비동기 스크립트로 확장하고 북메이커 행을 읽는 스크립트
+# (execute_async_script 전용; 행마다 클릭 후 MutationObserver로 확장 완료를 기다림, 다시 접지 않음)
+# arguments: [[[handicap, 핸디캡 행 XPath, 북메이커 행 XPath], ...], bookmaker_name 상대 XPath,
+#             odds_text 상대 XPath, 행 대기 ms, 확장 대기 ms, callback]
+# 반환값: {handicap: [[bookmaker, over, under], ...]} (행이 없거나 확장되지 않으면 빈 리스트)
+# 중간에 오류가 나도 그때까지 읽은 핸디캡만 담아 반환하며, 진행 중인 결과는
+# window.__getoddPartialOdds에도 남겨 스크립트 제한 시간 초과 후에도 읽을 수 있게 함
+# window.__getoddCancel이 true가 되면 다음 행을 클릭하지 않고 멈춤 (개별 처리와 클릭이 겹치지 않도록)
+_EXTRACT_ALL_ODDS_JS = """
+const [jobs, nameXPath, oddsXPath, rowTimeout, expandTimeout] = arguments;
+const done = arguments[arguments.length - 1];
+const first = (xpath, ctx) => document.evaluate(xpath, ctx || document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+const readRows = (xpath) => {
+    const rows = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const out = [];
+    for (let i = 0; i < rows.snapshotLength; i++) {
+        const row = rows.snapshotItem(i);
+        const name = first(nameXPath, row);
+        if (!name) continue;
+        const odds = document.evaluate(oddsXPath, row, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        out.push([
+            name.innerText.trim(),
+            odds.snapshotLength > 0 ? odds.snapshotItem(0).innerText.trim() : 'N/A',
+            odds.snapshotLength > 1 ? odds.snapshotItem(1).innerText.trim() : 'N/A'
+        ]);
+    }
+    return out.length ? out : null;
+};
+const waitFor = (probe, timeout) => new Promise((resolve) => {
+    const found = probe();
+    if (found) return resolve(found);
+    const observer = new MutationObserver(() => {
+        const value = probe();
+        if (value) { observer.disconnect(); clearTimeout(timer); resolve(value); }
+    });
+    const timer = setTimeout(() => { observer.disconnect(); resolve(null); }, timeout);
+    observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+});
+const out = {};
+window.__getoddPartialOdds = out;
+window.__getoddCancel = false;
+(async () => {
+    for (const [handicap, rowXPath, rowsXPath] of jobs) {
+        const row = await waitFor(() => first(rowXPath), rowTimeout);
+        if (window.__getoddCancel) return;
+        if (!row) { out[handicap] = []; continue; }
+        row.scrollIntoView({block: 'center', inline: 'nearest'});
+        row.click();
+        const rows = await waitFor(() => readRows(rowsXPath), expandTimeout);
+        if (window.__getoddCancel) return;
+        out[handicap] = rows || [];
+    }
+})().then(() => done(out), () => done(out));
+"""
+
+# XPath에 해당하는 노드가 생길 때까지 MutationObserver로 기다리는 스크립트 (execute_async_script 전용)
+# arguments: [XPath, 제한 시간 ms, callback]
+# 반환값: 제한 시간 안에 나타났으면 true, 아니면 false
+_WAIT_FOR_XPATH_JS = """
+const [xpath, timeout] = arguments;
+const done = arguments[arguments.length - 1];
+const found = () => document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null;
+if (found()) return done(true);
+const observer = new MutationObserver(() => {
+    if (found()) { observer.disconnect(); clearTimeout(timer); done(true); }
+});
+const timer = setTimeout(() => { observer.disconnect(); done(false); }, timeout);
+observer.observe(document.body, {childList: true, subtree: true});
+"""
+
+# 매치 헤더 필드를 한 번의 호출로 읽는 스크립트
+# arguments: [{필드명: [XPath, fallback XPath, ...]}]
+# 반환값: {필드명: innerText 또는 null} (선택자 순서대로 처음 찾은 요소 사용)
+_EXTRACT_MATCH_HEADER_JS = """
+const out = {};
+for (const [key, xpaths] of Object.entries(arguments[0])) {
+    out[key] = null;
+    for (const xpath of xpaths) {
+        const node = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        if (node) {
+            out[key] = node.innerText.trim();
+            break;
+        }
+    }
+}
+return out;
+"""
+
 
 def cleanup_chromedriver_processes():
     """Kill any stuck chromedriver processes"""
@@ -44,46 +185,219 @@ def cleanup_chromedriver_processes():
             pass
 
 
-def force_quit_driver(driver):
+def _driver_process_tree(driver) -> list:
+    """
+    chromedriver 프로세스와 그 자식(Chrome 브라우저/렌더러) 목록 (psutil이 없으면 빈 리스트)
+    
+    Args:
+        driver: WebDriver 인스턴스
+        
+    Returns:
+        psutil.Process 리스트 (자식 먼저, chromedriver 마지막)
+    """
+    process = getattr(getattr(driver, 'service', None), 'process', None)
+    if psutil is None or process is None:
+        return []
+    try:
+        parent = psutil.Process(process.pid)
+        return parent.children(recursive=True) + [parent]
+    except psutil.Error:
+        return []
+
+
+def force_quit_driver(driver, system_cleanup: bool = True):
     """
     Force quit driver with multiple fallback methods
     
     Args:
         driver: WebDriver instance to quit
+        system_cleanup: Also pkill every chromedriver/Chrome process on the host.
+            Must be False when other drivers are still in use (e.g. DriverPool).
     """
     if not driver:
         return
     
+    # quit() 전에 프로세스 트리를 기록해 두어야 고아가 된 렌더러까지 정리할 수 있음
+    procs = _driver_process_tree(driver)
+    
     try:
         # Try normal quit first
         driver.quit()
     except:
         pass
     
-    try:
-        # Try to kill the service process directly
-        if hasattr(driver, 'service') and hasattr(driver.service, 'process'):
-            if driver.service.process:
-                try:
-                    driver.service.process.terminate()
-                    time.sleep(0.5)
-                    if driver.service.process.poll() is None:
-                        driver.service.process.kill()
-                except:
-                    pass
-    except:
-        pass
+    if procs:
+        # 이 드라이버의 프로세스 트리만 종료 (남은 프로세스가 없으면 바로 반환)
+        alive = [p for p in procs if p.is_running()]
+        for p in alive:
+            try:
+                p.terminate()
+            except psutil.Error:
+                pass
+        _, alive = psutil.wait_procs(alive, timeout=2)
+        for p in alive:
+            try:
+                p.kill()
+            except psutil.Error:
+                pass
+    else:
+        try:
+            # Try to kill the service process directly
+            if hasattr(driver, 'service') and hasattr(driver.service, 'process'):
+                if driver.service.process:
+                    try:
+                        driver.service.process.terminate()
+                        time.sleep(0.5)
+                        if driver.service.process.poll() is None:
+                            driver.service.process.kill()
+                    except:
+                        pass
+        except:
+            pass
+    
+    # 브라우저가 종료된 뒤에 프로필 잠금을 풀어야 다음 드라이버가 같은 프로필을 안전하게 사용
+    _release_profile(driver)
     
     # Final cleanup at system level
-    cleanup_chromedriver_processes()
+    if system_cleanup:
+        cleanup_chromedriver_processes()
+
+
+def _get_chromedriver_path() -> str:
+    """
+    chromedriver 경로를 한 번만 탐색하고 결과를 캐시
+    
+    Returns:
+        chromedriver 실행 파일 경로
+    """
+    global _CHROMEDRIVER_PATH
+    
+    with _CHROMEDRIVER_LOCK:
+        if _CHROMEDRIVER_PATH:
+            return _CHROMEDRIVER_PATH
+        
+        # Chromium/Chrome 드라이버 자동 감지
+        chrome_driver_path = None
+        
+        # 1. chromium-chromedriver 확인 (Ubuntu/Debian)
+        if os.path.exists("/usr/bin/chromedriver"):
+            chrome_driver_path = "/usr/bin/chromedriver"
+        # 2. snap chromium-chromedriver 확인
+        elif os.path.exists("/snap/bin/chromium.chromedriver"):
+            chrome_driver_path = "/snap/bin/chromium.chromedriver"
+        # 3. 일반 chromedriver 확인
+        elif shutil.which("chromedriver"):
+            chrome_driver_path = shutil.which("chromedriver")
+        
+        if not chrome_driver_path:
+            # webdriver-manager로 자동 다운로드 (폴백)
+            try:
+                from webdriver_manager.chrome import ChromeDriverManager
+                chrome_driver_path = ChromeDriverManager().install()
+            except Exception:
+                raise Exception("ChromeDriver not found. Please install chromium-chromedriver or google-chrome-stable")
+        
+        _CHROMEDRIVER_PATH = chrome_driver_path
+        return _CHROMEDRIVER_PATH
 
 
-def create_driver(headless: bool = True) -> webdriver.Chrome:
+def _widen_connection_pool(driver: webdriver.Chrome):
+    """
+    chromedriver와의 keep-alive 연결 풀 크기를 늘림
+    
+    Selenium 4.15에는 ClientConfig가 없어 생성자에서 maxsize를 줄 수 없으므로,
+    명령 실행기의 PoolManager 설정을 바꾸고 기존 풀을 비워 새 크기로 다시 만들게 한다.
+    (동시에 여러 요청이 나가도 "Connection pool is full"로 연결을 버리고 다시 맺지 않음)
+    
+    Args:
+        driver: WebDriver 인스턴스
+    """
+    conn = getattr(driver.command_executor, '_conn', None)
+    if isinstance(conn, urllib3.PoolManager):
+        conn.connection_pool_kw['maxsize'] = CHROMEDRIVER_POOL_MAXSIZE
+        conn.clear()
+
+
+def _tmp_profile_root() -> Path:
+    """
+    드라이버 종료 시 삭제하는 임시 프로필을 둘 디렉토리 (여유 공간이 충분한 tmpfs가 있으면 디스크 대신 사용)
+    
+    워커별 고정 프로필은 실행이 끝나도 남아 있으므로 메모리 기반 tmpfs에 두지 않는다.
+    
+    Returns:
+        CHROME_PROFILE_TMPFS 또는 시스템 임시 디렉토리
+    """
+    global _TMP_PROFILE_ROOT
+    
+    if _TMP_PROFILE_ROOT is None:
+        root = Path(tempfile.gettempdir())
+        try:
+            st = os.statvfs(CHROME_PROFILE_TMPFS)
+            if st.f_bavail * st.f_frsize >= CHROME_PROFILE_TMPFS_MIN_FREE and os.access(CHROME_PROFILE_TMPFS, os.W_OK):
+                root = Path(CHROME_PROFILE_TMPFS)
+        except (AttributeError, OSError):
+            pass  # Windows (statvfs 없음) 또는 tmpfs 없음
+        _TMP_PROFILE_ROOT = root
+    return _TMP_PROFILE_ROOT
+
+
+def _acquire_profile(worker_id: int) -> tuple:
+    """
+    워커별 프로필 디렉토리를 잠그고 반환
+    
+    같은 호스트의 다른 실행이나 아직 종료 중인 이전 드라이버가 같은 프로필을 쓰고 있으면
+    Chrome이 "user data directory is already in use"로 시작하지 못하므로,
+    잠금을 얻지 못하면 새 임시 프로필을 사용한다 (캐시는 재사용하지 못함).
+    
+    Args:
+        worker_id: 워커 번호
+        
+    Returns:
+        (프로필 경로, 잠금 파일 또는 None, 종료 후 삭제할 임시 프로필 여부) 튜플
+    """
+    # 고정 프로필은 디스크(시스템 임시 디렉토리)에 둠
+    root = Path(tempfile.gettempdir())
+    name = f"{CHROME_PROFILE_PREFIX}{worker_id}"
+    if fcntl is None:
+        # 잠글 수 없으면 (Windows) 공유하지 않도록 매번 임시 프로필 사용
+        return Path(tempfile.mkdtemp(prefix=f"{name}-", dir=_tmp_profile_root())), None, True
+    
+    lock_file = open(root / f"{name}.lock", 'a')
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return Path(tempfile.mkdtemp(prefix=f"{name}-", dir=_tmp_profile_root())), None, True
+    profile_dir = root / name
+    profile_dir.mkdir(exist_ok=True)
+    return profile_dir, lock_file, False
+
+
+def _release_profile(driver):
+    """
+    _acquire_profile()로 얻은 프로필 잠금 해제 (임시 프로필이면 삭제)
+    
+    Args:
+        driver: WebDriver 인스턴스 (create_driver()가 profile_lock/profile_tmp_dir 속성을 설정)
+    """
+    lock_file = getattr(driver, 'profile_lock', None)
+    if lock_file is not None:
+        lock_file.close()
+        driver.profile_lock = None
+    tmp_dir = getattr(driver, 'profile_tmp_dir', None)
+    if tmp_dir is not None:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        driver.profile_tmp_dir = None
+
+
+def create_driver(headless: bool = True, worker_id: int = None) -> webdriver.Chrome:
     """
     WebDriver 인스턴스 생성
     
     Args:
         headless: 헤드리스 모드 여부
+        worker_id: 워커 번호. 지정하면 워커별 고정 프로필 디렉토리를 사용하여
+                   드라이버를 재시작해도 사이트 CSS/JS HTTP 캐시를 재사용
         
     Returns:
         Chrome WebDriver 인스턴스
@@ -99,14 +413,27 @@ def create_driver(headless: bool = True) -> webdriver.Chrome:
     options.add_argument("--disable-blink-features=AutomationControlled")
     options.add_argument("--disable-extensions")
     options.add_argument("--disable-setuid-sandbox")
-    options.add_argument("--disable-features=VizDisplayCompositor")
     options.add_argument("--window-size=1920,1080")
+    options.add_argument("--blink-settings=imagesEnabled=false")
     options.add_argument(f"user-agent={BROWSER_USER_AGENT}")
     
+    # 워커별 프로필 (Chrome이 프로필을 잠그므로 워커끼리, 실행끼리 공유하지 않음)
+    profile_lock = profile_tmp_dir = None
+    if worker_id is not None:
+        profile_dir, profile_lock, temporary = _acquire_profile(worker_id)
+        if temporary:
+            profile_tmp_dir = profile_dir
+        options.add_argument(f"--user-data-dir={profile_dir}")
+        options.add_argument(f"--disk-cache-size={CHROME_DISK_CACHE_SIZE}")
+    
+    # --disable-features는 마지막 값만 적용되므로 한 번에 모아서 전달
+    # (사이트별 프로세스 격리를 끄면 iframe마다 렌더러 프로세스가 생기지 않음)
+    disabled_features = ["VizDisplayCompositor", "TranslateUI", "BlinkGenPropertyTrees",
+                         "IsolateOrigins", "site-per-process"]
+    
     # GCP 환경을 위한 추가 옵션
     if platform.system() == "Linux":
-        options.add_argument("--disable-features=NetworkService")
-        options.add_argument("--disable-features=VizDisplayCompositor")
+        disabled_features.append("NetworkService")
         options.add_argument("--no-zygote")  # GCP에서 도움이 될 수 있음
     
     # Remove problematic options for macOS
@@ -114,7 +441,6 @@ def create_driver(headless: bool = True) -> webdriver.Chrome:
     # options.add_argument("--single-process")  # Problematic with newer Chrome
     options.add_argument("--disable-background-timer-throttling")
     options.add_argument("--disable-renderer-backgrounding")
-    options.add_argument("--disable-features=TranslateUI")
     options.add_argument("--disable-ipc-flooding-protection")
     
     # Add stability options for macOS
@@ -126,64 +452,65 @@ def create_driver(headless: bool = True) -> webdriver.Chrome:
     options.add_argument("--disable-default-apps")
     options.add_argument("--no-first-run")
     options.add_argument("--disable-backgrounding-occluded-windows")
-    options.add_argument("--disable-renderer-backgrounding")
-    options.add_argument("--disable-features=TranslateUI,BlinkGenPropertyTrees")
     options.add_argument("--force-color-profile=srgb")
     
+    # 헤드리스 수집에 필요 없는 백그라운드 작업 끄기
+    options.add_argument("--disable-hang-monitor")
+    options.add_argument("--mute-audio")
+    options.add_argument("--password-store=basic")
+    options.add_argument("--use-mock-keychain")
+    options.add_argument(f"--disable-features={','.join(disabled_features)}")
+    
     # 추가 안정성 옵션
     options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
     options.add_experimental_option('useAutomationExtension', False)
     options.add_experimental_option("prefs", {
         "profile.default_content_setting_values.notifications": 2,
         "profile.default_content_settings.popups": 0,
-        "profile.managed_default_content_settings.images": 1,  # Enable images (2 can cause issues)
+        "profile.managed_default_content_settings.images": 2,  # 이미지 로드 안 함 (텍스트만 수집)
         "download.default_directory": "/tmp",
         "download.prompt_for_download": False,
         "download.directory_upgrade": True,
         "safebrowsing.enabled": False
     })
     
+    # DOMContentLoaded 시점에 driver.get() 반환 (이미지/광고 등 load 이벤트는 기다리지 않음)
+    options.page_load_strategy = 'eager'
+    
     # macOS specific stability settings
     options.add_experimental_option('w3c', True)
     options.add_experimental_option('detach', False)
     
-    # Chromium/Chrome 드라이버 자동 감지
-    chrome_driver_path = None
-    
-    # 1. chromium-chromedriver 확인 (Ubuntu/Debian)
-    if os.path.exists("/usr/bin/chromedriver"):
-        chrome_driver_path = "/usr/bin/chromedriver"
-    # 2. snap chromium-chromedriver 확인
-    elif os.path.exists("/snap/bin/chromium.chromedriver"):
-        chrome_driver_path = "/snap/bin/chromium.chromedriver"
-    # 3. 일반 chromedriver 확인
-    elif shutil.which("chromedriver"):
-        chrome_driver_path = shutil.which("chromedriver")
-    
-    if chrome_driver_path:
-        # 시스템에 설치된 chromedriver 사용
-        service = Service(chrome_driver_path)
-    else:
-        # webdriver-manager로 자동 다운로드 (폴백)
-        try:
-            from webdriver_manager.chrome import ChromeDriverManager
-            service = Service(ChromeDriverManager().install())
-        except Exception:
-            raise Exception("ChromeDriver not found. Please install chromium-chromedriver or google-chrome-stable")
+    service = Service(_get_chromedriver_path())
     
     # Create driver with error handling
     max_attempts = 3
     for attempt in range(max_attempts):
         try:
             driver = webdriver.Chrome(service=service, options=options)
+            driver.profile_lock = profile_lock
+            driver.profile_tmp_dir = profile_tmp_dir
+            _widen_connection_pool(driver)
             # Set page load strategy and timeouts
-            driver.set_page_load_timeout(30)
-            driver.implicitly_wait(10)
+            driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+            # 암묵적 대기는 끔: 없는 요소의 fallback 탐색마다 수 초씩 멈추지 않도록
+            # 모든 대기는 명시적 WebDriverWait으로 처리
+            driver.implicitly_wait(0)
+            # 텍스트만 읽으므로 이미지/폰트/미디어/광고 트래커 요청은 CDP로 차단
+            try:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+            except Exception:
+                pass
             return driver
         except Exception as e:
             if attempt < max_attempts - 1:
                 time.sleep(2)  # Wait before retry
                 continue
+            if profile_lock is not None:
+                profile_lock.close()
+            if profile_tmp_dir is not None:
+                shutil.rmtree(profile_tmp_dir, ignore_errors=True)
             raise e
 
 
@@ -205,6 +532,36 @@ def is_driver_alive(driver: webdriver.Chrome) -> bool:
         return False
 
 
+def reset_browser_context(driver: webdriver.Chrome) -> bool:
+    """
+    브라우저 프로세스는 그대로 두고 새 탭을 열어 망가진 탭/렌더러를 교체
+    (Chrome 재시작보다 훨씬 빠름; 쿠키와 캐시는 유지)
+    
+    Args:
+        driver: WebDriver 인스턴스
+        
+    Returns:
+        True if the tab was replaced, False if a full restart is needed
+    """
+    try:
+        old_handles = driver.window_handles
+        if old_handles:
+            # 현재 탭이 이미 닫혔을 수 있으므로 남아 있는 탭으로 먼저 전환
+            driver.switch_to.window(old_handles[0])
+        driver.switch_to.new_window('tab')
+        new_handle = driver.current_window_handle
+        for handle in old_handles:
+            try:
+                driver.switch_to.window(handle)
+                driver.close()
+            except WebDriverException:
+                pass
+        driver.switch_to.window(new_handle)
+        return True
+    except WebDriverException:
+        return False
+
+
 def scrape_match_and_odds_with_driver(driver: webdriver.Chrome, base_url: str, 
                                       handicaps_to_scrape: List[str]) -> List:
     """
@@ -220,12 +577,10 @@ def scrape_match_and_odds_with_driver(driver: webdriver.Chrome, base_url: str,
     """
     all_odds_data = []
     
-    # Check if driver is still alive before proceeding
-    if not is_driver_alive(driver):
-        raise WebDriverException("Driver connection lost - needs restart")
-    
     league_name, season_info = parse_url_for_info(base_url)
     target_url = base_url.rstrip('/') + "/#over-under;2"
+    # 핸디캡별 XPath는 캐시되므로 같은 핸디캡이면 모든 경기에서 재사용
+    handicap_xpaths = [(h, _handicap_xpaths(h)) for h in handicaps_to_scrape]
 
     try:
         driver.get(target_url)
@@ -233,27 +588,50 @@ def scrape_match_and_odds_with_driver(driver: webdriver.Chrome, base_url: str,
         # Wait for page to load
         wait_for_page_ready(driver)
         
-        wait = WebDriverWait(driver, BROWSER_TIMEOUT)
+        wait = WebDriverWait(driver, BROWSER_TIMEOUT, poll_frequency=WAIT_POLL_FREQUENCY)
+        optional_wait = WebDriverWait(driver, OPTIONAL_ELEMENT_TIMEOUT, poll_frequency=WAIT_POLL_FREQUENCY)
         
-        # 쿠키 동의 버튼 처리
-        try:
-            cookie_btn = WebDriverWait(driver, 3).until(
-                EC.element_to_be_clickable((By.ID, XPATH_SELECTORS['cookie_button']))
-            )
-            cookie_btn.click()
-            time.sleep(0.5)
-        except TimeoutException:
-            pass
+        # 쿠키 동의 버튼 처리 (같은 드라이버에서 동의가 끝났으면 건너뜀)
+        if not getattr(driver, 'cookie_consent_done', False):
+            try:
+                cookie_btn = WebDriverWait(driver, 3, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                    EC.element_to_be_clickable((By.ID, XPATH_SELECTORS['cookie_button']))
+                )
+                cookie_btn.click()
+                # 배너가 사라질 때까지만 대기 (고정 sleep 대신)
+                WebDriverWait(driver, 3, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                    EC.invisibility_of_element_located((By.ID, XPATH_SELECTORS['cookie_button']))
+                )
+                driver.cookie_consent_done = True
+            except TimeoutException:
+                # 배너가 없으면 프로필에 동의 쿠키가 이미 있는 경우일 수 있음
+                if driver.get_cookie(CONSENT_COOKIE_NAME):
+                    driver.cookie_consent_done = True
         
         # 매치 정보 추출
         match_info = extract_match_info(driver, wait)
         
-        # 각 핸디캡별 배당률 수집
-        for handicap in handicaps_to_scrape:
-            odds_data = extract_odds_for_handicap(
-                driver, wait, handicap, match_info, 
-                league_name, season_info, base_url
-            )
+        # Over/Under 표가 로드될 때까지 한 번만 길게 대기
+        # (이후 개별 핸디캡 행은 없을 수도 있으므로 짧게 대기)
+        try:
+            wait.until(EC.presence_of_element_located((By.XPATH, XPATH_SELECTORS['over_under_rows'])))
+        except TimeoutException:
+            pass
+        
+        # 모든 핸디캡을 한 번의 스크립트로 확장/추출하고, 스크립트가 처리하지 못한 핸디캡만 개별 처리
+        batched_rows = extract_all_odds_rows(driver, handicap_xpaths)
+        for handicap, xpaths in handicap_xpaths:
+            if handicap in batched_rows:
+                odds_data = _build_odds_rows(
+                    batched_rows[handicap] or [], handicap, match_info,
+                    league_name, season_info, base_url
+                )
+            else:
+                odds_data = extract_odds_for_handicap(
+                    driver, wait, handicap, match_info,
+                    league_name, season_info, base_url,
+                    optional_wait=optional_wait, xpaths=xpaths
+                )
             all_odds_data.extend(odds_data)
 
     except Exception as e:
@@ -275,20 +653,44 @@ def wait_for_page_ready(driver: webdriver.Chrome, timeout: int = 10) -> bool:
     """
     try:
         # Wait for document ready state
-        WebDriverWait(driver, timeout).until(
-            lambda d: d.execute_script("return document.readyState") == "complete"
+        # (eager 전략이므로 'interactive'면 충분; dynamic content is covered by the element waits that follow)
+        WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY).until(
+            lambda d: d.execute_script("return document.readyState") in ("interactive", "complete")
         )
-        # Additional wait for dynamic content
-        time.sleep(1)
         return True
     except:
         return False
 
 
+def _parse_match_datetime(date_str: str) -> datetime:
+    """
+    "01 Jan 2024 20:00" 형식(DATE_PARSE_FORMAT)의 한국 시간 문자열을 직접 파싱
+    (형식이 다르면 strptime으로 처리)
+    
+    Args:
+        date_str: 날짜 문자열
+        
+    Returns:
+        KOREA_TZ가 지정된 datetime
+        
+    Raises:
+        ValueError: 날짜 형식이 맞지 않을 때
+    """
+    try:
+        day, month, year, hm = date_str.split()
+        hour, minute = hm.split(':')
+        return datetime(int(year), _MONTHS[month], int(day), int(hour), int(minute), tzinfo=_KOREA_TZ)
+    except (KeyError, ValueError):
+        return datetime.strptime(date_str, DATE_PARSE_FORMAT).replace(tzinfo=_KOREA_TZ)
+
+
 def extract_match_info(driver: webdriver.Chrome, wait: WebDriverWait) -> dict:
     """
     매치 기본 정보 추출
     
+    헤더(홈/원정 팀, 경기 시간)가 렌더링되면 execute_script 한 번으로
+    모든 필드의 텍스트를 읽어온다 (필드마다 WebDriver 왕복하지 않음).
+    
     Args:
         driver: WebDriver 인스턴스
         wait: WebDriverWait 인스턴스
@@ -298,76 +700,32 @@ def extract_match_info(driver: webdriver.Chrome, wait: WebDriverWait) -> dict:
     """
     match_info = {}
     
-    # Wait for page to be ready
-    wait_for_page_ready(driver)
+    # 헤더가 나타날 때까지만 대기 (없으면 fallback 선택자로 스냅샷)
+    try:
+        wait.until(EC.presence_of_element_located((By.XPATH, XPATH_SELECTORS['home_team'])))
+    except TimeoutException:
+        pass
     
-    # 팀 이름 추출 (더 관대한 대기)
     try:
-        # Try multiple selectors
-        home_team = None
-        away_team = None
-        
-        # Wait for any team element to be present first
-        try:
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//span[contains(@class, 'participant')]"))
-            )
-        except:
-            pass
-        
-        # Now try to get team names
-        try:
-            home_team = wait.until(
-                EC.presence_of_element_located((By.XPATH, XPATH_SELECTORS['home_team']))
-            ).text
-        except:
-            # Fallback selector
-            try:
-                home_team = driver.find_element(By.XPATH, "//div[@class='odds-header']//span[1]").text
-            except:
-                pass
-        
-        try:
-            away_team = wait.until(
-                EC.presence_of_element_located((By.XPATH, XPATH_SELECTORS['away_team']))
-            ).text
-        except:
-            # Fallback selector
-            try:
-                away_team = driver.find_element(By.XPATH, "//div[@class='odds-header']//span[2]").text
-            except:
-                pass
-        
-        match_info['home_team'] = home_team if home_team else 'N/A'
-        match_info['away_team'] = away_team if away_team else 'N/A'
-        
-    except Exception:
-        match_info['home_team'] = 'N/A'
-        match_info['away_team'] = 'N/A'
+        header = driver.execute_script(_EXTRACT_MATCH_HEADER_JS, {
+            'home_team': [XPATH_SELECTORS['home_team'], "//div[@class='odds-header']//span[1]"],
+            'away_team': [XPATH_SELECTORS['away_team'], "//div[@class='odds-header']//span[2]"],
+            'time_container': [XPATH_SELECTORS['time_container'], "//div[contains(@class, 'date')]"],
+        }) or {}
+    except WebDriverException:
+        header = {}
+    
+    match_info['home_team'] = header.get('home_team') or 'N/A'
+    match_info['away_team'] = header.get('away_team') or 'N/A'
 
-    # 날짜 추출 (더 관대한 대기)
+    # 날짜 추출
     try:
-        time_container = None
-        # Try with shorter timeout first
-        try:
-            time_container = WebDriverWait(driver, 5).until(
-                EC.presence_of_element_located((By.XPATH, XPATH_SELECTORS['time_container']))
-            )
-        except:
-            # Try alternative selector
-            try:
-                time_container = driver.find_element(By.XPATH, "//div[contains(@class, 'date')]")
-            except:
-                pass
-        
-        if time_container:
-            date_parts_text = time_container.text.split('\n')
+        time_text = header.get('time_container')
+        if time_text:
+            date_parts_text = time_text.split('\n')
             date_str = f"{date_parts_text[1].strip(',')} {date_parts_text[2]}"
             
-            local_dt = datetime.strptime(date_str, DATE_PARSE_FORMAT)
-            korea_tz = pytz.timezone(KOREA_TZ)
-            korea_dt = korea_tz.localize(local_dt)
-            utc_dt = korea_dt.astimezone(pytz.utc)
+            utc_dt = _parse_match_datetime(date_str).astimezone(_UTC)
             match_info['match_date_utc'] = utc_dt.strftime(UTC_FORMAT)
         else:
             match_info['match_date_utc'] = 'N/A'
@@ -377,10 +735,101 @@ def extract_match_info(driver: webdriver.Chrome, wait: WebDriverWait) -> dict:
     return match_info
 
 
+@lru_cache(maxsize=64)
+def _handicap_xpaths(handicap: str) -> tuple:
+    """
+    핸디캡별 XPath 생성 (핸디캡 값에만 의존하므로 캐시하여 프로세스 전체에서 한 번만 생성)
+    
+    Args:
+        handicap: 핸디캡 값
+        
+    Returns:
+        (핸디캡 행, 확장 컨테이너, 북메이커 행) XPath 튜플
+    """
+    target_row_xpath = XPATH_SELECTORS['target_row'].format(handicap)
+    expanded_container_xpath = XPATH_SELECTORS['expanded_container'].format(target_row_xpath)
+    bookmaker_rows_xpath = XPATH_SELECTORS['bookmaker_rows'].format(expanded_container_xpath)
+    return target_row_xpath, expanded_container_xpath, bookmaker_rows_xpath
+
+
+def _build_odds_rows(bookmaker_rows: List, handicap: str, match_info: dict,
+                     league_name: str, season_info: str, base_url: str) -> List:
+    """
+    [bookmaker, over, under] 목록을 CSV 행으로 변환 (배당이 없는 _MISSING_ODDS 값은 제외)
+
+    Args:
+        bookmaker_rows: 북메이커별 [이름, Over 배당, Under 배당] 리스트
+        handicap: 핸디캡 값
+        match_info: 매치 정보
+        league_name: 리그 이름
+        season_info: 시즌 정보
+        base_url: 기본 URL
+
+    Returns:
+        배당률 데이터 리스트
+    """
+    odds_data = []
+    over_label = f"Over {handicap}"
+    under_label = f"Under {handicap}"
+    # 모든 행에 공통인 앞쪽 컬럼은 한 번만 만들고 행마다 이어 붙임 (같은 문자열 객체를 공유)
+    match_cols = [
+        match_info['match_date_utc'],
+        match_info['home_team'],
+        match_info['away_team'],
+        league_name,
+        season_info,
+    ]
+    for bookmaker, over_odds, under_odds in bookmaker_rows:
+        if over_odds not in _MISSING_ODDS:
+            odds_data.append(match_cols + [bookmaker, over_label, over_odds, base_url])
+
+        if under_odds not in _MISSING_ODDS:
+            odds_data.append(match_cols + [bookmaker, under_label, under_odds, base_url])
+    return odds_data
+
+
+def extract_all_odds_rows(driver: webdriver.Chrome, handicap_xpaths: List) -> dict:
+    """
+    모든 핸디캡 행을 한 번의 비동기 스크립트로 확장하고 북메이커 행을 읽음
+    (핸디캡마다 찾기/클릭/대기/추출/닫기 왕복을 하던 것을 한 번의 호출로 줄임)
+
+    Args:
+        driver: WebDriver 인스턴스
+        handicap_xpaths: [(핸디캡, _handicap_xpaths() 결과), ...]
+
+    Returns:
+        {핸디캡: [[bookmaker, over, under], ...]}
+        (스크립트가 중간에 실패하면 그때까지 처리한 핸디캡만 포함; 빠진 핸디캡은
+        호출 측에서 extract_odds_for_handicap()으로 처리)
+    """
+    jobs = [[h, xpaths[0], xpaths[2]] for h, xpaths in handicap_xpaths]
+    # 스크립트가 최악의 경우에도 끝날 수 있도록 제한 시간 설정 (드라이버별로 필요할 때만 갱신)
+    script_timeout = len(jobs) * (OPTIONAL_ELEMENT_TIMEOUT + BROWSER_TIMEOUT) + 5
+    try:
+        if getattr(driver, 'script_timeout', 0) < script_timeout:
+            driver.set_script_timeout(script_timeout)
+            driver.script_timeout = script_timeout
+        return driver.execute_async_script(
+            _EXTRACT_ALL_ODDS_JS, jobs,
+            XPATH_SELECTORS['bookmaker_name'], XPATH_SELECTORS['odds_text'],
+            OPTIONAL_ELEMENT_TIMEOUT * 1000, BROWSER_TIMEOUT * 1000
+        ) or {}
+    except (TimeoutException, JavascriptException):
+        # 페이지에서 계속 실행 중인 스크립트를 먼저 멈춘 뒤(개별 처리의 클릭과 겹치지 않도록),
+        # 이미 확장한 행을 다시 클릭(=접기)하지 않도록 스크립트가 남긴 부분 결과를 사용
+        try:
+            return driver.execute_script(
+                "window.__getoddCancel = true; return window.__getoddPartialOdds || null;"
+            ) or {}
+        except WebDriverException:
+            return {}
+
+
 def extract_odds_for_handicap(driver: webdriver.Chrome, wait: WebDriverWait, 
                               handicap: str, match_info: dict, 
                               league_name: str, season_info: str, 
-                              base_url: str) -> List:
+                              base_url: str, optional_wait: WebDriverWait = None,
+                              xpaths: tuple = None) -> List:
     """
     특정 핸디캡에 대한 배당률 추출
     
@@ -392,75 +841,42 @@ def extract_odds_for_handicap(driver: webdriver.Chrome, wait: WebDriverWait,
         league_name: 리그 이름
         season_info: 시즌 정보
         base_url: 매치 URL
+        optional_wait: 핸디캡 행 탐색용 짧은 WebDriverWait (해당 핸디캡이 없는 경기용)
+        xpaths: 미리 만든 _handicap_xpaths(handicap) 결과 (없으면 여기서 생성)
         
     Returns:
         배당률 데이터 리스트
     """
     odds_data = []
-    target_row = None
     
     try:
         # 핸디캡 행 찾기
-        target_row_xpath = XPATH_SELECTORS['target_row'].format(handicap)
-        target_row = wait.until(EC.presence_of_element_located((By.XPATH, target_row_xpath)))
-        
-        # 스크롤 및 클릭하여 확장
-        driver.execute_script("arguments[0].scrollIntoView({block: 'center', inline: 'nearest'});", target_row)
-        time.sleep(SCROLL_PAUSE)
-        wait.until(EC.element_to_be_clickable(target_row)).click()
-
-        # 확장된 컨테이너 대기
-        expanded_container_xpath = XPATH_SELECTORS['expanded_container'].format(target_row_xpath)
-        wait.until(EC.visibility_of_element_located((By.XPATH, expanded_container_xpath)))
-        time.sleep(EXPAND_PAUSE)
-
-        # 북메이커별 배당률 추출
-        bookmaker_rows_xpath = XPATH_SELECTORS['bookmaker_rows'].format(expanded_container_xpath)
-        bookmaker_rows = driver.find_elements(By.XPATH, bookmaker_rows_xpath)
-        
-        for row in bookmaker_rows:
-            try:
-                bookmaker = row.find_element(By.XPATH, XPATH_SELECTORS['bookmaker_name']).text
-                odds_elements = row.find_elements(By.XPATH, XPATH_SELECTORS['odds_text'])
-                
-                over_odds = odds_elements[0].text if len(odds_elements) > 0 else 'N/A'
-                under_odds = odds_elements[1].text if len(odds_elements) > 1 else 'N/A'
-
-                if over_odds not in ['N/A', '-']:
-                    odds_data.append([
-                        match_info['match_date_utc'], 
-                        match_info['home_team'], 
-                        match_info['away_team'], 
-                        league_name, 
-                        season_info, 
-                        bookmaker, 
-                        f"Over {handicap}", 
-                        over_odds, 
-                        base_url
-                    ])
-                
-                if under_odds not in ['N/A', '-']:
-                    odds_data.append([
-                        match_info['match_date_utc'], 
-                        match_info['home_team'], 
-                        match_info['away_team'], 
-                        league_name, 
-                        season_info, 
-                        bookmaker, 
-                        f"Under {handicap}", 
-                        under_odds, 
-                        base_url
-                    ])
-
-            except NoSuchElementException:
-                continue
-
-        # 행 닫기
-        if target_row:
+        if xpaths is None:
+            xpaths = _handicap_xpaths(handicap)
+        target_row_xpath, _, bookmaker_rows_xpath = xpaths
+        if optional_wait is None:
+            optional_wait = WebDriverWait(driver, OPTIONAL_ELEMENT_TIMEOUT, poll_frequency=WAIT_POLL_FREQUENCY)
+        # 이미 확장된 행(일괄 스크립트가 펼쳐 둔 행 등)은 클릭하면 접히므로 그대로 읽음
+        if not driver.find_elements(By.XPATH, bookmaker_rows_xpath):
+            target_row = optional_wait.until(EC.presence_of_element_located((By.XPATH, target_row_xpath)))
+            
+            # 스크롤 및 클릭하여 확장 (element_to_be_clickable 대기가 스크롤 완료를 보장)
             driver.execute_script("arguments[0].scrollIntoView({block: 'center', inline: 'nearest'});", target_row)
-            time.sleep(WAIT_DELAY)
-            target_row.click()
-            time.sleep(SCROLL_PAUSE)
+            wait.until(EC.element_to_be_clickable(target_row)).click()
+
+            # 확장된 컨테이너에 북메이커 행이 생길 때까지 브라우저 안에서 대기 (폴링 없이 DOM 변경 시점에 반환)
+            if not driver.execute_async_script(_WAIT_FOR_XPATH_JS, bookmaker_rows_xpath, BROWSER_TIMEOUT * 1000):
+                return odds_data
+
+        # 북메이커별 배당률 추출 (한 번의 execute_script로 모든 행 읽기)
+        bookmaker_rows = driver.execute_script(
+            _EXTRACT_BOOKMAKER_ROWS_JS, bookmaker_rows_xpath,
+            XPATH_SELECTORS['bookmaker_name'], XPATH_SELECTORS['odds_text']
+        ) or []
+        # 행은 다시 접지 않음 (다음 URL에서 페이지를 새로 열고, 핸디캡 행끼리는 XPath가 독립적)
+        odds_data = _build_odds_rows(
+            bookmaker_rows, handicap, match_info, league_name, season_info, base_url
+        )
 
     except Exception:
         pass  # 해당 핸디캡이 없는 경우 무시
@@ -468,11 +884,71 @@ def extract_odds_for_handicap(driver: webdriver.Chrome, wait: WebDriverWait,
     return odds_data
 
 
+class ScraperSession:
+    """
+    하나의 브라우저로 여러 URL을 연속 수집하는 세션
+
+    URL마다 Chrome을 새로 띄우지 않고 세션이 끝날 때까지 같은 드라이버를 사용한다.
+    쿠키는 지우지 않는다 (쿠키 동의 상태를 유지해야 동의 배너 처리를 건너뛸 수 있음).
+
+    사용 예:
+        with ScraperSession(headless=True) as session:
+            for url in urls:
+                rows = session.scrape(url, handicaps)
+    """
+
+    def __init__(self, headless: bool = True, worker_id: int = None):
+        """
+        Args:
+            headless: 헤드리스 모드 여부
+            worker_id: create_driver()에 전달할 워커 번호 (프로필 디렉토리 고정용)
+        """
+        self.headless = headless
+        self.worker_id = worker_id
+        self.driver = None
+
+    def __enter__(self):
+        self.driver = create_driver(self.headless, worker_id=self.worker_id)
+        return self
+
+    def scrape(self, url: str, handicaps: List[str]) -> List:
+        """
+        세션의 드라이버로 URL 하나를 수집 (WebDriver 오류 시 한 번 재시도)
+
+        드라이버가 죽었으면 새로 만든 뒤 재시도하고, 살아 있으면 같은 드라이버로 재시도한다.
+
+        Args:
+            url: 스크래핑할 URL
+            handicaps: 수집할 핸디캡 리스트
+
+        Returns:
+            수집된 배당률 데이터 리스트
+        """
+        if self.driver is None:
+            self.driver = create_driver(self.headless, worker_id=self.worker_id)
+        try:
+            return scrape_match_and_odds_with_driver(self.driver, url, handicaps)
+        except WebDriverException:
+            if not is_driver_alive(self.driver):
+                force_quit_driver(self.driver, system_cleanup=False)
+                self.driver = create_driver(self.headless, worker_id=self.worker_id)
+            return scrape_match_and_odds_with_driver(self.driver, url, handicaps)
+
+    def close(self):
+        """드라이버 종료"""
+        if self.driver is not None:
+            force_quit_driver(self.driver, system_cleanup=False)
+            self.driver = None
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
 def scrape_match_and_odds(base_url: str, handicaps_to_scrape: List[str], 
                          headless: bool = True) -> List:
     """
     주어진 URL에서 경기 정보와 여러 핸디캡 배당률을 수집하여 반환하는 함수
-    (backward compatibility를 위한 wrapper 함수)
+    (backward compatibility를 위한 wrapper 함수; 여러 URL은 ScraperSession 사용)
     
     Args:
         base_url: 스크래핑할 URL
@@ -482,8 +958,5 @@ def scrape_match_and_odds(base_url: str, handicaps_to_scrape: List[str],
     Returns:
         수집된 배당률 데이터 리스트
     """
-    driver = create_driver(headless)
-    try:
-        return scrape_match_and_odds_with_driver(driver, base_url, handicaps_to_scrape)
-    finally:
-        driver.quit()
\ No newline at end of file
+    with ScraperSession(headless) as session:
+        return session.scrape(base_url, handicaps_to_scrape)
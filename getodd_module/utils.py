@@ -2,32 +2,52 @@
 Utility functions for file operations and logging
 """
 
+import atexit
 import json
 import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, Iterator, List
 from .config import LOG_FORMAT, PROCESSING_LOG_FILE
 
+try:
+    import orjson  # optional: C 구현으로 체크포인트 직렬화가 더 빠름
+except ImportError:
+    orjson = None
+
+# setup_logging()이 시작한 백그라운드 로그 기록 스레드
+_LOG_LISTENER = None
+
 
 def setup_logging(output_dir: Path) -> logging.Logger:
     """
     로깅 설정
     
+    스크래핑 스레드는 로그 레코드를 큐에 넣기만 하고, 파일/콘솔 기록은
+    백그라운드 QueueListener 스레드가 처리한다 (프로세스 종료 시 남은 로그까지 기록).
+    
     Args:
         output_dir: 로그 파일을 저장할 디렉토리
         
     Returns:
         설정된 Logger 인스턴스
     """
+    global _LOG_LISTENER
+    
     logger = logging.getLogger('odds_scraper')
     logger.setLevel(logging.INFO)
     
     # 기존 핸들러 제거 (중복 방지)
     logger.handlers.clear()
+    if _LOG_LISTENER is not None:
+        _LOG_LISTENER.stop()
+        _LOG_LISTENER = None
     
     # 파일 핸들러
     log_file = output_dir / PROCESSING_LOG_FILE
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    file_handler = logging.FileHandler(log_file, encoding='utf-8', delay=True)
     file_handler.setLevel(logging.INFO)
     
     # 콘솔 핸들러
@@ -39,12 +59,52 @@ def setup_logging(output_dir: Path) -> logging.Logger:
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
     
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # 실제 기록은 백그라운드 스레드에서
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    _LOG_LISTENER = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    _LOG_LISTENER.start()
     
     return logger
 
 
+def _stop_log_listener():
+    """종료 시 큐에 남은 로그를 모두 기록하고 리스너 스레드 정리"""
+    global _LOG_LISTENER
+    if _LOG_LISTENER is not None:
+        _LOG_LISTENER.stop()
+        _LOG_LISTENER = None
+
+
+# logging 모듈의 종료 처리(핸들러 flush/close)보다 먼저 실행됨 (atexit은 역순 실행)
+atexit.register(_stop_log_listener)
+
+
+def iter_csv_files(input_dir: Path) -> Iterator[str]:
+    """
+    입력 디렉토리 아래의 CSV 파일 경로를 찾는 대로 반환 (정렬하지 않음)
+    
+    재귀 호출 대신 스택으로 순회하므로 깊은 디렉토리에서도 재귀 한도에 걸리지 않는다.
+    
+    Args:
+        input_dir: CSV 파일을 검색할 디렉토리
+        
+    Yields:
+        CSV 파일 경로 문자열
+    """
+    if not input_dir.is_dir():
+        return
+    stack = [str(input_dir)]
+    while stack:
+        # DirEntry는 이름/타입 정보를 캐시하므로 항목마다 Path 생성이나 stat 호출이 없음
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.csv'):
+                    yield entry.path
+
+
 def find_csv_files(input_dir: Path) -> List[Path]:
     """
     입력 디렉토리에서 모든 CSV 파일 찾기
@@ -55,13 +115,49 @@ def find_csv_files(input_dir: Path) -> List[Path]:
     Returns:
         정렬된 CSV 파일 경로 리스트
     """
-    csv_files = list(input_dir.rglob('*.csv'))
-    return sorted(csv_files)
+    return [Path(p) for p in sorted(iter_csv_files(input_dir))]
+
+
+def _json_bytes(data, indent: bool = False) -> bytes:
+    """
+    JSON 직렬화 (orjson이 있으면 사용)
+    
+    Args:
+        data: 직렬화할 데이터
+        indent: True이면 2칸 들여쓰기
+        
+    Returns:
+        UTF-8 JSON 바이트
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, indent=2).encode('utf-8')
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(data: bytes):
+    """JSON 역직렬화 (orjson이 있으면 사용; 잘못된 입력은 ValueError)"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _write_json_atomic(path: Path, data, indent: bool = False):
+    """
+    임시 파일에 쓴 뒤 교체하여 JSON 파일 저장 (중간에 종료되어도 기존 파일이 깨지지 않음)
+    
+    Args:
+        path: 저장할 파일 경로
+        data: 저장할 데이터
+        indent: True이면 2칸 들여쓰기
+    """
+    tmp_file = path.with_suffix('.tmp')
+    tmp_file.write_bytes(_json_bytes(data, indent))
+    tmp_file.replace(path)
 
 
 def load_checkpoint(checkpoint_file: Path) -> Dict:
     """
-    체크포인트 파일 로드
+    체크포인트 파일 로드 (스냅샷 + 이벤트 로그 재생)
     
     Args:
         checkpoint_file: 체크포인트 파일 경로
@@ -69,27 +165,65 @@ def load_checkpoint(checkpoint_file: Path) -> Dict:
     Returns:
         체크포인트 데이터 딕셔너리
     """
+    checkpoint_data = {'processed_files': [], 'failed_urls': []}
     if checkpoint_file.exists():
-        with open(checkpoint_file, 'r') as f:
-            return json.load(f)
-    return {'processed_files': [], 'failed_urls': []}
+        checkpoint_data = _json_loads(checkpoint_file.read_bytes())
+    
+    # 마지막 스냅샷 이후 append_checkpoint_event()로 기록된 이벤트 반영
+    # (스냅샷 저장 후 로그 삭제 전에 종료되었으면 이미 스냅샷에 있는 파일의 이벤트는 건너뜀)
+    log_file = checkpoint_file.with_suffix('.ndjson')
+    if log_file.exists():
+        # 구분자를 '/'로 통일하여 비교 (Windows에서 str(path)로 저장된 스냅샷 포함)
+        processed = {p.replace('\\', '/') for p in checkpoint_data['processed_files']}
+        with open(log_file, 'rb') as f:
+            for line in f:
+                try:
+                    event = _json_loads(line)
+                except ValueError:
+                    continue  # 기록 도중 종료되어 잘린 줄
+                done = event['done'].replace('\\', '/')
+                if done in processed:
+                    continue
+                processed.add(done)
+                checkpoint_data['processed_files'].append(event['done'])
+                checkpoint_data['failed_urls'].extend(event.get('failed', []))
+    return checkpoint_data
 
 
 def save_checkpoint(checkpoint_file: Path, checkpoint_data: Dict):
     """
-    체크포인트 저장
+    체크포인트 스냅샷 저장 (임시 파일에 쓴 뒤 교체하여 중간에 종료되어도 파일이 깨지지 않음)
+    
+    스냅샷에 모든 상태가 담기므로 이벤트 로그는 삭제한다.
     
     Args:
         checkpoint_file: 체크포인트 파일 경로
         checkpoint_data: 저장할 체크포인트 데이터
     """
-    with open(checkpoint_file, 'w') as f:
-        json.dump(checkpoint_data, f, indent=2)
+    _write_json_atomic(checkpoint_file, checkpoint_data)
+    
+    log_file = checkpoint_file.with_suffix('.ndjson')
+    if log_file.exists():
+        log_file.unlink()
+
+
+def append_checkpoint_event(checkpoint_file: Path, event: Dict):
+    """
+    CSV 파일 하나의 처리 완료를 이벤트 로그에 한 줄로 추가
+    (누적된 전체 상태를 매번 다시 쓰지 않음)
+    
+    Args:
+        checkpoint_file: 체크포인트 파일 경로 (로그는 같은 이름의 .ndjson)
+        event: {'done': 처리한 CSV 경로, 'failed': 해당 파일의 실패 URL 리스트}
+    """
+    log_file = checkpoint_file.with_suffix('.ndjson')
+    with open(log_file, 'ab') as f:
+        f.write(_json_bytes(event) + b'\n')
 
 
 def save_failed_urls(output_dir: Path, failed_urls: List[Dict], filename: str = 'failed_urls.json'):
     """
-    실패한 URL 목록 저장
+    실패한 URL 목록 저장 (임시 파일에 쓴 뒤 교체)
     
     Args:
         output_dir: 출력 디렉토리
@@ -98,7 +232,6 @@ def save_failed_urls(output_dir: Path, failed_urls: List[Dict], filename: str =
     """
     if failed_urls:
         failed_file = output_dir / filename
-        with open(failed_file, 'w') as f:
-            json.dump(failed_urls, f, indent=2)
+        _write_json_atomic(failed_file, failed_urls, indent=True)
         return failed_file
     return None
\ No newline at end of file
@@ -5,6 +5,7 @@ Provides comprehensive monitoring of scraping progress with statistics and alert
 """
 
 import os
+import re
 import sys
 import json
 import time
@@ -12,7 +13,19 @@ import argparse
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Tuple
-import subprocess
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+import math
+
+try:
+    import psutil  # optional: process counts where /proc is not available (macOS)
+except ImportError:
+    psutil = None
+
+try:
+    import orjson  # optional: faster checkpoint parsing
+except ImportError:
+    orjson = None
 
 # ANSI color codes
 class Colors:
@@ -26,9 +39,75 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+# Fixed dashboard lines (built once instead of on every refresh)
+HEADER_RULE = f"{Colors.BOLD}{Colors.HEADER}{'='*80}{Colors.ENDC}"
+FOOTER_RULE = f"{Colors.HEADER}{'='*80}{Colors.ENDC}"
+SECTION_FILES = f"{Colors.BOLD}📁 Output Files:{Colors.ENDC}"
+SECTION_PROCESSING = f"{Colors.BOLD}📊 Processing Statistics:{Colors.ENDC}"
+SECTION_CHECKPOINT = f"{Colors.BOLD}🎯 Checkpoint Info:{Colors.ENDC}"
+SECTION_SYSTEM = f"{Colors.BOLD}💻 System Resources:{Colors.ENDC}"
+SECTION_RECENT = f"{Colors.BOLD}📜 Recent Activity:{Colors.ENDC}"
+SECTION_ERRORS = f"{Colors.BOLD}⚠️  Error Summary:{Colors.ENDC}"
+NO_CSV_FILES = f"  {Colors.YELLOW}No CSV files yet{Colors.ENDC}"
+
+# Cursor home + clear screen
+CLEAR_SCREEN = '\033[H\033[2J'
+
 def clear_screen():
     """Clear terminal screen"""
-    os.system('clear' if os.name == 'posix' else 'cls')
+    sys.stdout.write(CLEAR_SCREEN)
+    sys.stdout.flush()
+
+def write_frame(lines: List[str]):
+    """Clear the screen and write a fully built dashboard frame with a single write and flush"""
+    sys.stdout.write(CLEAR_SCREEN + '\n'.join(lines) + '\n')
+    sys.stdout.flush()
+
+# Line counts of output CSVs: path -> (inode, bytes counted, newline count, ends with newline)
+# Output files only grow while scraping, so each refresh counts just the appended bytes
+_csv_line_cache: Dict[str, Tuple[int, int, int, bool]] = {}
+CSV_COUNT_CHUNK_SIZE = 1024 * 1024
+
+def count_csv_lines(csv_file: str, st: os.stat_result) -> int:
+    """Count lines in a file, reading only the bytes appended since the previous count"""
+    key = csv_file
+    cached = _csv_line_cache.get(key)
+    if cached and cached[0] == st.st_ino and cached[1] <= st.st_size:
+        _, offset, newlines, ends_with_newline = cached
+    else:
+        # New, replaced or truncated file: count from the start
+        offset, newlines, ends_with_newline = 0, 0, True
+    
+    if offset < st.st_size:
+        # Unbuffered reads into one reusable buffer; bytearray.count scans it in C
+        buf = bytearray(min(CSV_COUNT_CHUNK_SIZE, st.st_size - offset))
+        with open(csv_file, 'rb', buffering=0) as f:
+            f.seek(offset)
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                newlines += buf.count(b'\n', 0, n)
+                offset += n
+                ends_with_newline = buf[n - 1] == 0x0A
+    
+    _csv_line_cache[key] = (st.st_ino, offset, newlines, ends_with_newline)
+    # A last line without a trailing newline still counts
+    return newlines + (0 if ends_with_newline else 1)
+
+def get_dir_signature(output_dir: Path) -> Tuple:
+    """Cheap fingerprint of the output tree (path, size, mtime of every file, including league subdirectories)"""
+    signature = []
+    dirs = [str(output_dir)]
+    while dirs:
+        with os.scandir(dirs.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry.path)
+                elif entry.is_file():
+                    st = entry.stat()
+                    signature.append((entry.path, st.st_size, st.st_mtime_ns))
+    return tuple(sorted(signature))
 
 def get_file_stats(output_dir: Path) -> Dict:
     """Get statistics from output files"""
@@ -39,35 +118,78 @@ def get_file_stats(output_dir: Path) -> Dict:
         'last_modified': None
     }
     
-    # Get CSV files
-    csv_files = list(output_dir.glob('*.csv'))
-    for csv_file in csv_files:
-        if csv_file.stat().st_size > 0:
-            stats['csv_files'].append(csv_file.name)
-            stats['file_sizes'][csv_file.name] = csv_file.stat().st_size
-            
-            # Count lines (minus header)
+    # Get CSV files (one scandir pass; each entry is stat'ed once)
+    latest_mtime = None
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if not name.endswith('.csv') or name.startswith('.'):
+                continue
             try:
-                with open(csv_file, 'r') as f:
-                    line_count = sum(1 for line in f) - 1
+                st = entry.stat()
+            except OSError:
+                continue
+            if st.st_size > 0:
+                stats['csv_files'].append(name)
+                stats['file_sizes'][name] = st.st_size
+                
+                # Count lines (minus header)
+                try:
+                    line_count = count_csv_lines(entry.path, st) - 1
                     stats['total_records'] += max(0, line_count)
-            except:
-                pass
-            
-            # Track last modified
-            mtime = datetime.fromtimestamp(csv_file.stat().st_mtime)
-            if stats['last_modified'] is None or mtime > stats['last_modified']:
-                stats['last_modified'] = mtime
+                except:
+                    pass
+                
+                # Track last modified
+                if latest_mtime is None or st.st_mtime > latest_mtime:
+                    latest_mtime = st.st_mtime
+    
+    if latest_mtime is not None:
+        stats['last_modified'] = datetime.fromtimestamp(latest_mtime)
     
     return stats
 
+# Log classification patterns (each runs once over the block of newly appended text)
+_WORKER_RE = re.compile(r'Worker\s*(\d+)\s*:')
+_ERROR_LINE_RE = re.compile(r'^.*(?:Error|error).*$', re.MULTILINE)
+# Group number = priority when a line mentions several kinds
+_ERROR_KIND_RE = re.compile(r'(?i)(timeout)|(chrome)|(connection)')
+_ERROR_KIND_NAMES = {1: 'Timeout', 2: 'Chrome Error', 3: 'Connection'}
+
+def _classify_error_line(line: str) -> str:
+    """Error kind of a log line: first matching kind in priority order, else Unknown"""
+    kinds = [kind.lastindex for kind in _ERROR_KIND_RE.finditer(line)]
+    return _ERROR_KIND_NAMES[min(kinds)] if kinds else 'Unknown'
+
+# Per-log parse state so each refresh only scans bytes appended since the last one
+_log_states: Dict[str, Dict] = {}
+LOG_TAIL_BLOCK_SIZE = 8192
+
+def _read_tail_lines(f, end: int, tail_lines: int) -> List[str]:
+    """Read the last tail_lines lines before byte offset end by seeking backwards in blocks"""
+    blocks = []
+    pos = end
+    newlines = 0
+    while pos > 0 and newlines <= tail_lines:
+        step = min(LOG_TAIL_BLOCK_SIZE, pos)
+        pos -= step
+        f.seek(pos)
+        blocks.append(f.read(step))
+        newlines += blocks[-1].count(b'\n')
+    data = b''.join(reversed(blocks))
+    return data.decode('utf-8', errors='replace').splitlines()[-tail_lines:]
+
+# Recent activity lines kept (and shown) per kind
+RECENT_SUCCESSES_SHOWN = 3
+RECENT_FAILURES_SHOWN = 2
+
 def parse_log_file(log_file: Path, tail_lines: int = 100) -> Dict:
-    """Parse processing log for statistics"""
+    """Parse processing log for statistics (totals are updated incrementally across calls)"""
     stats = {
         'total_processed': 0,
         'total_failed': 0,
-        'recent_successes': [],
-        'recent_failures': [],
+        'recent_successes': deque(maxlen=RECENT_SUCCESSES_SHOWN),
+        'recent_failures': deque(maxlen=RECENT_FAILURES_SHOWN),
         'workers_active': set(),
         'processing_rate': 0,
         'error_types': {}
@@ -76,38 +198,51 @@ def parse_log_file(log_file: Path, tail_lines: int = 100) -> Dict:
     if not log_file.exists():
         return stats
     
-    # Read entire file for totals
     try:
-        with open(log_file, 'r') as f:
-            lines = f.readlines()
+        st = log_file.stat()
+        key = str(log_file)
+        state = _log_states.get(key)
+        if state is None or state['inode'] != st.st_ino or st.st_size < state['offset']:
+            # First call, or the log was replaced/truncated: count from the start
+            state = {
+                'inode': st.st_ino,
+                'offset': 0,
+                'total_processed': 0,
+                'total_failed': 0,
+                'workers_active': set(),
+                'error_types': Counter()
+            }
+            _log_states[key] = state
+        
+        with open(log_file, 'rb') as f:
+            # Totals: only the complete lines appended since the last call
+            f.seek(state['offset'])
+            new_data = f.read()
+            consumed = new_data.rfind(b'\n') + 1
+            state['offset'] += consumed
+            
+            # Classify the whole block with compiled patterns instead of testing line by line
+            text = new_data[:consumed].decode('utf-8', errors='replace')
+            state['total_processed'] += text.count('✓')
+            state['total_failed'] += text.count('✗')
             
-        for line in lines:
-            if '✓' in line:
-                stats['total_processed'] += 1
-            elif '✗' in line:
-                stats['total_failed'] += 1
-                
             # Track worker activity
-            if 'Worker' in line:
-                parts = line.split('Worker')
-                if len(parts) > 1:
-                    worker_num = parts[1].split(':')[0].strip()
-                    if worker_num.isdigit():
-                        stats['workers_active'].add(int(worker_num))
+            state['workers_active'].update(int(n) for n in _WORKER_RE.findall(text))
             
             # Track error types
-            if 'Error' in line or 'error' in line:
-                error_type = 'Unknown'
-                if 'timeout' in line.lower():
-                    error_type = 'Timeout'
-                elif 'chrome' in line.lower():
-                    error_type = 'Chrome Error'
-                elif 'connection' in line.lower():
-                    error_type = 'Connection'
-                stats['error_types'][error_type] = stats['error_types'].get(error_type, 0) + 1
+            state['error_types'].update(
+                _classify_error_line(match.group()) for match in _ERROR_LINE_RE.finditer(text)
+            )
+            
+            # Recent entries: read just the tail of the file
+            tail = _read_tail_lines(f, state['offset'], tail_lines)
+        
+        stats['total_processed'] = state['total_processed']
+        stats['total_failed'] = state['total_failed']
+        stats['workers_active'] = set(state['workers_active'])
+        stats['error_types'] = dict(state['error_types'])
         
-        # Get recent entries
-        for line in lines[-tail_lines:]:
+        for line in tail:
             if '✓' in line:
                 # Extract timestamp if available
                 parts = line.split(']')
@@ -123,19 +258,51 @@ def parse_log_file(log_file: Path, tail_lines: int = 100) -> Dict:
     
     return stats
 
+# Last parsed checkpoint, reused while the file's mtime is unchanged
+_checkpoint_cache = {'key': None, 'data': {}}
+
 def parse_checkpoint(checkpoint_file: Path) -> Dict:
     """Parse checkpoint file for progress info"""
-    if not checkpoint_file.exists():
+    try:
+        st = checkpoint_file.stat()
+    except OSError:
         return {}
     
+    key = (st.st_ino, st.st_size, st.st_mtime_ns)
+    if key == _checkpoint_cache['key']:
+        return _checkpoint_cache['data']
+    
     try:
-        with open(checkpoint_file, 'r') as f:
-            return json.load(f)
+        raw = checkpoint_file.read_bytes()
+        data = orjson.loads(raw) if orjson else json.loads(raw)
     except:
         return {}
+    _checkpoint_cache['key'] = key
+    _checkpoint_cache['data'] = data
+    return data
+
+def _count_processes() -> Tuple[int, int]:
+    """Count Chrome/chromedriver and Python processes by process name"""
+    names = []
+    if os.path.isdir('/proc'):
+        for pid in os.listdir('/proc'):
+            if not pid.isdigit():
+                continue
+            try:
+                with open(f'/proc/{pid}/comm') as f:
+                    names.append(f.read().strip().lower())
+            except OSError:
+                continue  # process exited while scanning
+    elif psutil is not None:
+        for proc in psutil.process_iter(['name']):
+            names.append((proc.info['name'] or '').lower())
+    
+    chrome = sum(1 for name in names if name.startswith(('chrome', 'chromium', 'google chrome')))
+    python = sum(1 for name in names if name.startswith('python'))
+    return chrome, python
 
 def get_system_stats() -> Dict:
-    """Get system resource statistics"""
+    """Get system resource statistics (read from /proc and statvfs, no subprocesses)"""
     stats = {
         'memory': 'N/A',
         'cpu': 'N/A',
@@ -144,176 +311,203 @@ def get_system_stats() -> Dict:
         'python_processes': 0
     }
     
+    # Memory usage (used = total - available, as reported by `free`)
     try:
-        # Memory usage
-        result = subprocess.run(['free', '-h'], capture_output=True, text=True)
-        if result.returncode == 0:
-            lines = result.stdout.split('\n')
-            if len(lines) > 1:
-                mem_parts = lines[1].split()
-                if len(mem_parts) >= 3:
-                    stats['memory'] = f"{mem_parts[2]}/{mem_parts[1]}"
-        
-        # Disk usage
-        result = subprocess.run(['df', '-h', '.'], capture_output=True, text=True)
-        if result.returncode == 0:
-            lines = result.stdout.split('\n')
-            if len(lines) > 1:
-                disk_parts = lines[1].split()
-                if len(disk_parts) >= 5:
-                    stats['disk'] = f"{disk_parts[2]}/{disk_parts[1]} ({disk_parts[4]})"
-        
-        # Process counts
-        result = subprocess.run(['ps', 'aux'], capture_output=True, text=True)
-        if result.returncode == 0:
-            processes = result.stdout.lower()
-            stats['chrome_processes'] = processes.count('chrome') + processes.count('chromium')
-            stats['python_processes'] = processes.count('python')
-            
-    except:
+        mem = {}
+        with open('/proc/meminfo') as f:
+            for line in f:
+                key, value = line.split(':', 1)
+                if key in ('MemTotal', 'MemAvailable'):
+                    mem[key] = int(value.split()[0]) * 1024
+                    if len(mem) == 2:
+                        break
+        stats['memory'] = f"{format_size(mem['MemTotal'] - mem['MemAvailable'])}/{format_size(mem['MemTotal'])}"
+    except (OSError, KeyError, ValueError):
+        pass
+    
+    # Disk usage (Use% computed like `df`: used / (used + available to non-root))
+    try:
+        st = os.statvfs('.')
+        total = st.f_blocks * st.f_frsize
+        used = (st.f_blocks - st.f_bfree) * st.f_frsize
+        usable = used + st.f_bavail * st.f_frsize
+        percent = math.ceil(used * 100 / usable) if usable else 0
+        stats['disk'] = f"{format_size(used)}/{format_size(total)} ({percent}%)"
+    except (OSError, AttributeError):
+        pass
+    
+    # Process counts
+    try:
+        stats['chrome_processes'], stats['python_processes'] = _count_processes()
+    except Exception:
         pass
     
     return stats
 
-def calculate_eta(total_urls: int, processed: int, start_time: datetime) -> str:
-    """Calculate estimated time of arrival"""
-    if processed == 0:
+def calculate_eta(total_urls: int, processed: int, elapsed: float, now: datetime) -> str:
+    """Calculate estimated time of arrival from elapsed monotonic seconds"""
+    if processed == 0 or elapsed <= 0:
         return "Calculating..."
     
-    elapsed = (datetime.now() - start_time).total_seconds()
     rate = processed / elapsed
     remaining = total_urls - processed
     
     if rate > 0:
-        eta_seconds = remaining / rate
-        eta = datetime.now() + timedelta(seconds=eta_seconds)
+        eta = now + timedelta(seconds=remaining / rate)
         return eta.strftime("%H:%M:%S")
     
     return "Unknown"
 
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
 def format_size(size_bytes: int) -> str:
     """Format file size in human readable format"""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f}{unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f}TB"
+    # Unit index straight from the bit length (each unit is 2**10 of the previous)
+    i = min(max(0, (size_bytes.bit_length() - 1) // 10), len(SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * i)):.1f}{SIZE_UNITS[i]}"
 
 def display_dashboard(country: str, output_dir: Path, refresh_rate: int = 5):
     """Display monitoring dashboard"""
-    start_time = datetime.now()
+    start_mono = time.monotonic()
+    last_signature = None
+    # The stats collectors are independent and syscall-bound, so one tick runs them side by side
+    pool = ThreadPoolExecutor(max_workers=4)
+    # Lines that only depend on the arguments
+    title = f"{Colors.BOLD}{Colors.CYAN}   GetOdd Monitoring Dashboard - {country.upper()}{Colors.ENDC}"
+    footer = f"Refreshing every {refresh_rate} seconds. Press Ctrl+C to exit."
+    # Bind colors to locals for the refresh loop (avoids a global + attribute lookup per use)
+    GREEN, YELLOW, RED, CYAN, BLUE, ENDC = (
+        Colors.GREEN, Colors.YELLOW, Colors.RED, Colors.CYAN, Colors.BLUE, Colors.ENDC
+    )
     
     while True:
         try:
-            clear_screen()
+            # Build the whole frame, then write it at once (no per-line flushes or `clear` fork)
+            out = []
+            # One clock read per tick; elapsed time comes from the monotonic clock
+            now = datetime.now()
+            elapsed = time.monotonic() - start_mono
             
             # Header
-            print(f"{Colors.BOLD}{Colors.HEADER}{'='*80}{Colors.ENDC}")
-            print(f"{Colors.BOLD}{Colors.CYAN}   GetOdd Monitoring Dashboard - {country.upper()}{Colors.ENDC}")
-            print(f"{Colors.BOLD}{Colors.HEADER}{'='*80}{Colors.ENDC}")
-            print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            print(f"Running for: {str(datetime.now() - start_time).split('.')[0]}")
-            print()
+            out.append(HEADER_RULE)
+            out.append(title)
+            out.append(HEADER_RULE)
+            out.append(f"Time: {now.strftime('%Y-%m-%d %H:%M:%S')}")
+            out.append(f"Running for: {timedelta(seconds=int(elapsed))}")
+            out.append("")
             
             # Check if output directory exists
             if not output_dir.exists():
-                print(f"{Colors.YELLOW}⚠ Output directory not found: {output_dir}{Colors.ENDC}")
-                print(f"Waiting for scraping to start...")
+                out.append(f"{YELLOW}⚠ Output directory not found: {output_dir}{ENDC}")
+                out.append("Waiting for scraping to start...")
+                write_frame(out)
                 time.sleep(refresh_rate)
                 continue
             
+            sys_future = pool.submit(get_system_stats)
+            
+            # Re-read files only when something in the output directory changed
+            log_file = output_dir / 'processing_log.txt'
+            checkpoint_file = output_dir / 'checkpoint.json'
+            signature = get_dir_signature(output_dir)
+            if signature != last_signature:
+                file_future = pool.submit(get_file_stats, output_dir)
+                log_future = pool.submit(parse_log_file, log_file)
+                checkpoint_future = pool.submit(parse_checkpoint, checkpoint_file)
+                file_stats = file_future.result()
+                log_stats = log_future.result()
+                checkpoint = checkpoint_future.result()
+                last_signature = signature
+            
             # File statistics
-            file_stats = get_file_stats(output_dir)
-            print(f"{Colors.BOLD}📁 Output Files:{Colors.ENDC}")
+            out.append(SECTION_FILES)
             if file_stats['csv_files']:
                 for csv_file in sorted(file_stats['csv_files']):
                     size = format_size(file_stats['file_sizes'][csv_file])
-                    print(f"  • {csv_file}: {Colors.GREEN}{size}{Colors.ENDC}")
-                print(f"  Total records: {Colors.CYAN}{file_stats['total_records']:,}{Colors.ENDC}")
+                    out.append(f"  • {csv_file}: {GREEN}{size}{ENDC}")
+                out.append(f"  Total records: {CYAN}{file_stats['total_records']:,}{ENDC}")
                 if file_stats['last_modified']:
-                    last_update = (datetime.now() - file_stats['last_modified']).total_seconds()
+                    last_update = (now - file_stats['last_modified']).total_seconds()
                     if last_update < 60:
-                        print(f"  Last update: {Colors.GREEN}{int(last_update)}s ago{Colors.ENDC}")
+                        out.append(f"  Last update: {GREEN}{int(last_update)}s ago{ENDC}")
                     else:
-                        print(f"  Last update: {Colors.YELLOW}{int(last_update/60)}m ago{Colors.ENDC}")
+                        out.append(f"  Last update: {YELLOW}{int(last_update/60)}m ago{ENDC}")
             else:
-                print(f"  {Colors.YELLOW}No CSV files yet{Colors.ENDC}")
-            print()
+                out.append(NO_CSV_FILES)
+            out.append("")
             
             # Log statistics
-            log_file = output_dir / 'processing_log.txt'
-            log_stats = parse_log_file(log_file)
-            
-            print(f"{Colors.BOLD}📊 Processing Statistics:{Colors.ENDC}")
+            out.append(SECTION_PROCESSING)
             success_rate = 0
             if log_stats['total_processed'] + log_stats['total_failed'] > 0:
                 success_rate = (log_stats['total_processed'] / 
                               (log_stats['total_processed'] + log_stats['total_failed'])) * 100
             
-            print(f"  Successful: {Colors.GREEN}{log_stats['total_processed']}{Colors.ENDC}")
-            print(f"  Failed: {Colors.RED}{log_stats['total_failed']}{Colors.ENDC}")
-            print(f"  Success rate: {Colors.CYAN}{success_rate:.1f}%{Colors.ENDC}")
+            out.append(f"  Successful: {GREEN}{log_stats['total_processed']}{ENDC}")
+            out.append(f"  Failed: {RED}{log_stats['total_failed']}{ENDC}")
+            out.append(f"  Success rate: {CYAN}{success_rate:.1f}%{ENDC}")
             
             if log_stats['workers_active']:
-                print(f"  Active workers: {Colors.BLUE}{sorted(log_stats['workers_active'])}{Colors.ENDC}")
-            print()
+                out.append(f"  Active workers: {BLUE}{sorted(log_stats['workers_active'])}{ENDC}")
+            out.append("")
             
             # Checkpoint info
-            checkpoint_file = output_dir / 'checkpoint.json'
-            checkpoint = parse_checkpoint(checkpoint_file)
             if checkpoint:
-                print(f"{Colors.BOLD}🎯 Checkpoint Info:{Colors.ENDC}")
+                out.append(SECTION_CHECKPOINT)
                 if 'current_file' in checkpoint:
-                    print(f"  Current file: {Colors.CYAN}{Path(checkpoint['current_file']).name}{Colors.ENDC}")
+                    out.append(f"  Current file: {CYAN}{Path(checkpoint['current_file']).name}{ENDC}")
                 if 'processed_urls' in checkpoint:
-                    print(f"  Processed URLs: {Colors.GREEN}{len(checkpoint['processed_urls'])}{Colors.ENDC}")
+                    out.append(f"  Processed URLs: {GREEN}{len(checkpoint['processed_urls'])}{ENDC}")
                 if 'total_urls' in checkpoint and 'processed_urls' in checkpoint:
                     total = checkpoint['total_urls']
                     processed = len(checkpoint['processed_urls'])
                     progress = (processed / total) * 100 if total > 0 else 0
-                    eta = calculate_eta(total, processed, start_time)
-                    print(f"  Progress: {Colors.CYAN}{processed}/{total} ({progress:.1f}%){Colors.ENDC}")
-                    print(f"  ETA: {Colors.YELLOW}{eta}{Colors.ENDC}")
-                print()
+                    eta = calculate_eta(total, processed, elapsed, now)
+                    out.append(f"  Progress: {CYAN}{processed}/{total} ({progress:.1f}%){ENDC}")
+                    out.append(f"  ETA: {YELLOW}{eta}{ENDC}")
+                out.append("")
             
             # System statistics
-            sys_stats = get_system_stats()
-            print(f"{Colors.BOLD}💻 System Resources:{Colors.ENDC}")
-            print(f"  Memory: {Colors.CYAN}{sys_stats['memory']}{Colors.ENDC}")
-            print(f"  Disk: {Colors.CYAN}{sys_stats['disk']}{Colors.ENDC}")
-            print(f"  Chrome processes: {Colors.BLUE}{sys_stats['chrome_processes']}{Colors.ENDC}")
-            print(f"  Python processes: {Colors.BLUE}{sys_stats['python_processes']}{Colors.ENDC}")
-            print()
+            sys_stats = sys_future.result()
+            out.append(SECTION_SYSTEM)
+            out.append(f"  Memory: {CYAN}{sys_stats['memory']}{ENDC}")
+            out.append(f"  Disk: {CYAN}{sys_stats['disk']}{ENDC}")
+            out.append(f"  Chrome processes: {BLUE}{sys_stats['chrome_processes']}{ENDC}")
+            out.append(f"  Python processes: {BLUE}{sys_stats['python_processes']}{ENDC}")
+            out.append("")
             
             # Recent activity
             if log_stats['recent_successes'] or log_stats['recent_failures']:
-                print(f"{Colors.BOLD}📜 Recent Activity:{Colors.ENDC}")
-                for success in log_stats['recent_successes'][-3:]:
-                    print(f"  {Colors.GREEN}✓{Colors.ENDC} {success[:80]}")
-                for failure in log_stats['recent_failures'][-2:]:
-                    print(f"  {Colors.RED}✗{Colors.ENDC} {failure[:80]}")
-                print()
+                out.append(SECTION_RECENT)
+                for success in log_stats['recent_successes']:
+                    out.append(f"  {GREEN}✓{ENDC} {success[:80]}")
+                for failure in log_stats['recent_failures']:
+                    out.append(f"  {RED}✗{ENDC} {failure[:80]}")
+                out.append("")
             
             # Error summary
             if log_stats['error_types']:
-                print(f"{Colors.BOLD}⚠️  Error Summary:{Colors.ENDC}")
+                out.append(SECTION_ERRORS)
                 for error_type, count in sorted(log_stats['error_types'].items(), 
                                                key=lambda x: x[1], reverse=True):
-                    print(f"  {error_type}: {Colors.YELLOW}{count}{Colors.ENDC}")
-                print()
+                    out.append(f"  {error_type}: {YELLOW}{count}{ENDC}")
+                out.append("")
             
             # Footer
-            print(f"{Colors.HEADER}{'='*80}{Colors.ENDC}")
-            print(f"Refreshing every {refresh_rate} seconds. Press Ctrl+C to exit.")
+            out.append(FOOTER_RULE)
+            out.append(footer)
+            write_frame(out)
             
             time.sleep(refresh_rate)
             
         except KeyboardInterrupt:
-            print(f"\n{Colors.YELLOW}Monitoring stopped.{Colors.ENDC}")
+            print(f"\n{YELLOW}Monitoring stopped.{ENDC}")
             break
         except Exception as e:
-            print(f"{Colors.RED}Error: {e}{Colors.ENDC}")
+            print(f"{RED}Error: {e}{ENDC}")
             time.sleep(refresh_rate)
+    
+    pool.shutdown(wait=False)
 
 def main():
     parser = argparse.ArgumentParser(description='Monitor GetOdd scraping progress')
@@ -148,9 +148,7 @@ if [ -f "requirements.txt" ]; then
 else
     pip install \
         selenium==4.15.2 \
-        webdriver-manager==4.0.1 \
-        pandas==2.1.3 \
-        pytz==2023.3
+        webdriver-manager==4.0.1
 fi
 print_success "Python dependencies installed"
 
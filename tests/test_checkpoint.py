@@ -0,0 +1,73 @@
+"""
+Tests for checkpoint snapshot + event log replay
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from getodd_module.utils import (
+    load_checkpoint, save_checkpoint, append_checkpoint_event
+)
+
+
+class LoadCheckpointTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.checkpoint_file = Path(self._tmp.name) / 'checkpoint.json'
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_missing_checkpoint(self):
+        self.assertEqual(load_checkpoint(self.checkpoint_file),
+                         {'processed_files': [], 'failed_urls': []})
+
+    def test_replays_events_after_snapshot(self):
+        save_checkpoint(self.checkpoint_file, {'processed_files': ['a/x.csv'], 'failed_urls': []})
+        append_checkpoint_event(self.checkpoint_file, {'done': 'a/y.csv', 'failed': [{'url': 'u1'}]})
+
+        data = load_checkpoint(self.checkpoint_file)
+
+        self.assertEqual(data['processed_files'], ['a/x.csv', 'a/y.csv'])
+        self.assertEqual(data['failed_urls'], [{'url': 'u1'}])
+
+    def test_save_checkpoint_clears_event_log(self):
+        append_checkpoint_event(self.checkpoint_file, {'done': 'a/x.csv', 'failed': []})
+        save_checkpoint(self.checkpoint_file, {'processed_files': ['a/x.csv'], 'failed_urls': []})
+
+        self.assertFalse(self.checkpoint_file.with_suffix('.ndjson').exists())
+
+    def test_replay_is_idempotent_when_log_outlives_snapshot(self):
+        # 스냅샷을 쓴 뒤 이벤트 로그를 지우기 전에 종료된 경우
+        append_checkpoint_event(self.checkpoint_file, {'done': 'a/x.csv', 'failed': [{'url': 'u1'}]})
+        self.checkpoint_file.write_text(json.dumps(
+            {'processed_files': ['a/x.csv'], 'failed_urls': [{'url': 'u1'}]}
+        ))
+
+        data = load_checkpoint(self.checkpoint_file)
+
+        self.assertEqual(data['processed_files'], ['a/x.csv'])
+        self.assertEqual(data['failed_urls'], [{'url': 'u1'}])
+
+    def test_replay_matches_windows_snapshot_paths(self):
+        self.checkpoint_file.write_text(json.dumps(
+            {'processed_files': ['a\\x.csv'], 'failed_urls': []}
+        ))
+        append_checkpoint_event(self.checkpoint_file, {'done': 'a/x.csv', 'failed': []})
+
+        self.assertEqual(load_checkpoint(self.checkpoint_file)['processed_files'], ['a\\x.csv'])
+
+    def test_skips_truncated_last_event(self):
+        save_checkpoint(self.checkpoint_file, {'processed_files': [], 'failed_urls': []})
+        append_checkpoint_event(self.checkpoint_file, {'done': 'a/x.csv', 'failed': []})
+        with open(self.checkpoint_file.with_suffix('.ndjson'), 'ab') as f:
+            f.write(b'{"done": "a/y.cs')
+
+        self.assertEqual(load_checkpoint(self.checkpoint_file)['processed_files'], ['a/x.csv'])
+
+
+if __name__ == '__main__':
+    unittest.main()
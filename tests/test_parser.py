@@ -0,0 +1,56 @@
+"""
+Tests for league/season parsing from match URLs
+"""
+
+import unittest
+
+from getodd_module.parser import parse_url_for_info, _parse_league_season_slug
+
+
+class ParseLeagueSeasonSlugTest(unittest.TestCase):
+
+    def test_two_year_season(self):
+        self.assertEqual(_parse_league_season_slug('jupiler-league-2020-2021'),
+                         ('Jupiler League', '2020-2021'))
+
+    def test_single_year_season_is_expanded(self):
+        self.assertEqual(_parse_league_season_slug('allsvenskan-2020'),
+                         ('Allsvenskan', '2020-2021'))
+
+    def test_league_name_with_digits(self):
+        self.assertEqual(_parse_league_season_slug('2-bundesliga-2019-2020'),
+                         ('2 Bundesliga', '2019-2020'))
+
+    def test_slug_without_season(self):
+        self.assertEqual(_parse_league_season_slug('premier-league'),
+                         ('Premier League', 'N/A'))
+
+
+class ParseUrlForInfoTest(unittest.TestCase):
+
+    def test_match_url(self):
+        url = 'https://www.oddsportal.com/football/belgium/jupiler-league-2020-2021/antwerp-anderlecht-Iusx5MVa/'
+        self.assertEqual(parse_url_for_info(url), ('Jupiler League', '2020-2021'))
+
+    def test_match_url_without_trailing_slash(self):
+        url = 'https://www.oddsportal.com/football/sweden/allsvenskan-2020/kalmar-jonkoping-zVSIDrhH'
+        self.assertEqual(parse_url_for_info(url), ('Allsvenskan', '2020-2021'))
+
+    def test_match_url_with_fragment(self):
+        url = 'https://www.oddsportal.com/football/belgium/jupiler-league-2020-2021/antwerp-anderlecht-Iusx5MVa/#over-under;2'
+        self.assertEqual(parse_url_for_info(url), ('Jupiler League', '2020-2021'))
+
+    def test_league_url_with_fragment(self):
+        url = 'https://www.oddsportal.com/football/belgium/jupiler-league-2020-2021/#results'
+        self.assertEqual(parse_url_for_info(url), ('Jupiler League', '2020-2021'))
+
+    def test_non_football_url_falls_back_to_second_last_part(self):
+        url = 'https://www.oddsportal.com/basketball/usa/nba-2021-2022/lakers-celtics-abc123/'
+        self.assertEqual(parse_url_for_info(url), ('Nba', '2021-2022'))
+
+    def test_unparseable_url(self):
+        self.assertEqual(parse_url_for_info('nonsense'), ('N/A', 'N/A'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+"""
+Tests for WebDriver error classification and progress logging
+"""
+
+import logging
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from concurrent.futures import Future
+from unittest import mock
+
+from getodd_module import processor
+from getodd_module.processor import _classify_error, _ProgressLog, _RESTART, _RESET
+
+
+class ClassifyErrorTest(unittest.TestCase):
+
+    def test_restart_errors(self):
+        for msg in (
+            "HTTPConnectionPool(host='localhost', port=9515): Read timed out.",
+            "Max retries exceeded with url: /session/abc/url",
+            "Message: chrome not reachable",
+            "Message: session not created: This version of ChromeDriver only supports Chrome version 114",
+            "Service /usr/bin/chromedriver unexpectedly exited. Status code was: -9",
+            "Message: Can not connect to the Service /usr/bin/chromedriver",
+        ):
+            with self.subTest(msg=msg):
+                self.assertEqual(_classify_error(msg), _RESTART)
+
+    def test_lost_local_session_restarts(self):
+        self.assertEqual(_classify_error("invalid session id: localhost session deleted"), _RESTART)
+
+    def test_reset_errors(self):
+        for msg in (
+            "Message: no such window: target window already closed",
+            "Message: No such window",
+            "Message: disconnected: not connected to DevTools",
+        ):
+            with self.subTest(msg=msg):
+                self.assertEqual(_classify_error(msg), _RESET)
+
+    def test_restart_wins_over_reset(self):
+        self.assertEqual(_classify_error("chrome not reachable (disconnected)"), _RESTART)
+
+    def test_generic_webdriver_errors_restart(self):
+        for msg in (
+            "Message: \nStacktrace:\n#0 0x55d5 <unknown>",
+            "Message: unknown error: cannot determine loading status",
+        ):
+            with self.subTest(msg=msg):
+                self.assertEqual(_classify_error(msg), _RESTART)
+
+    def test_regular_errors(self):
+        for msg in ("", "list index out of range", "Message: element click intercepted"):
+            with self.subTest(msg=msg):
+                self.assertIsNone(_classify_error(msg))
+
+
+class ProgressLogTest(unittest.TestCase):
+
+    def setUp(self):
+        self.logger = logging.getLogger('test_progress')
+        patcher = mock.patch.multiple(processor, PROGRESS_LOG_EVERY=3, PROGRESS_LOG_INTERVAL=3600)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _ticks(self, progress, oks):
+        with self.assertLogs(self.logger, level='INFO') as logs:
+            self.logger.info('start')
+            for ok in oks:
+                progress.tick(ok)
+        return logs.output[1:]
+
+    def test_logs_every_n_and_at_total(self):
+        progress = _ProgressLog(self.logger, 5)
+        lines = self._ticks(progress, [True, True, False, True, True])
+
+        self.assertEqual(lines, [
+            'INFO:test_progress:Progress: 3/5 URLs (2 ok, 1 failed)',
+            'INFO:test_progress:Progress: 5/5 URLs (4 ok, 1 failed)',
+        ])
+
+    def test_logs_after_interval(self):
+        progress = _ProgressLog(self.logger, 10)
+        with mock.patch.object(processor.time, 'monotonic', return_value=progress._last_log + 3600):
+            lines = self._ticks(progress, [True])
+
+        self.assertEqual(lines, ['INFO:test_progress:Progress: 1/10 URLs (1 ok, 0 failed)'])
+
+    def test_on_done_counts_failures_and_skips_cancelled(self):
+        progress = _ProgressLog(self.logger, 10)
+        ok, failed, raised, cancelled = Future(), Future(), Future(), Future()
+        ok.set_result(([], None))
+        failed.set_result(([], {'url': 'u'}))
+        raised.set_exception(RuntimeError('boom'))
+        cancelled.cancel()
+
+        for future in (ok, failed, raised, cancelled):
+            progress.on_done(future)
+
+        self.assertEqual((progress.ok, progress.failed), (1, 2))
+
+
+class _FakePool:
+    size = 2
+
+
+def _fake_process_url(url, pool, handicaps, logger, position=''):
+    return [[url]], None
+
+
+class ProcessCsvFilesTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.dir = Path(self._tmp.name)
+        self.logger = logging.getLogger('test_process_csv_files')
+        patcher = mock.patch.object(processor, 'process_url', side_effect=_fake_process_url)
+        self.process_url = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _csv(self, name, text):
+        path = self.dir / name
+        path.write_text(text)
+        return path
+
+    def test_progress_total_counts_every_file_up_front(self):
+        files = [
+            self._csv('a.csv', 'match_url\nu1\nu2\n'),
+            self._csv('b.csv', 'match_url\nu3\n'),
+        ]
+        with mock.patch.multiple(processor, PROGRESS_LOG_EVERY=1):
+            with self.assertLogs(self.logger, level='INFO') as logs:
+                results = list(processor.process_csv_files(files, [], self.logger, _FakePool()))
+
+        progress = [line for line in logs.output if 'Progress:' in line]
+        self.assertEqual(len(progress), 3)
+        self.assertTrue(all('/3 URLs' in line for line in progress), progress)
+        self.assertEqual([rows for _, rows, _ in results], [[['u1'], ['u2']], [['u3']]])
+
+    def test_files_without_match_url_are_not_reported(self):
+        bad = self._csv('bad.csv', 'url\nu1\n')
+        good = self._csv('good.csv', 'match_url\nu2\n\n')
+        missing = self.dir / 'missing.csv'
+
+        with self.assertLogs(self.logger, level='ERROR') as logs:
+            results = list(processor.process_csv_files([bad, missing, good], [], self.logger, _FakePool()))
+
+        self.assertEqual(results, [(good, [['u2']], [])])
+        self.assertEqual(len(logs.output), 2)
+
+    def test_pending_tasks_are_bounded_while_the_head_url_is_slow(self):
+        files = [
+            self._csv('a.csv', 'match_url\n' + ''.join(f'a{i}\n' for i in range(10))),
+            self._csv('b.csv', 'match_url\n' + ''.join(f'b{i}\n' for i in range(10))),
+        ]
+        started = []
+        head_release = threading.Event()
+        started_while_head_blocked = []
+
+        def slow_head(url, pool, handicaps, logger, position=''):
+            started.append(url)
+            if url == 'a0':
+                head_release.wait(5)
+                started_while_head_blocked.append(len(started))
+            elif len(started) >= processor.MAX_PENDING_PER_WORKER * _FakePool.size:
+                head_release.set()
+            return [[url]], None
+
+        self.process_url.side_effect = slow_head
+        with mock.patch.object(processor, 'MAX_PENDING_PER_WORKER', 2):
+            results = list(processor.process_csv_files(files, [], self.logger, _FakePool()))
+
+        self.assertEqual(started_while_head_blocked, [4])
+        self.assertEqual(sum(len(rows) for _, rows, _ in results), 20)
+        self.assertEqual([row[0] for row in results[1][1]], [f'b{i}' for i in range(10)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+"""
+Tests for match date parsing
+"""
+
+import unittest
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from getodd_module.config import DATE_PARSE_FORMAT, KOREA_TZ
+from getodd_module.scraper import _parse_match_datetime
+
+
+class ParseMatchDatetimeTest(unittest.TestCase):
+
+    def test_matches_strptime(self):
+        for date_str in ("01 Jan 2024 20:00", "9 Feb 2021 07:05", "31 Dec 2020 23:59", "29 Feb 2024 00:00"):
+            with self.subTest(date_str=date_str):
+                expected = datetime.strptime(date_str, DATE_PARSE_FORMAT).replace(tzinfo=ZoneInfo(KOREA_TZ))
+                self.assertEqual(_parse_match_datetime(date_str), expected)
+
+    def test_attaches_korea_timezone(self):
+        parsed = _parse_match_datetime("01 Jul 2023 12:30")
+        self.assertEqual(parsed.utcoffset().total_seconds(), 9 * 3600)
+
+    def test_strptime_fallback_handles_other_month_case(self):
+        parsed = _parse_match_datetime("01 JAN 2024 20:00")
+        self.assertEqual((parsed.year, parsed.month, parsed.day, parsed.hour), (2024, 1, 1, 20))
+
+    def test_invalid_dates_raise_value_error(self):
+        for date_str in ("", "Today, 20:00", "32 Jan 2024 20:00", "01 Foo 2024 20:00", "29 Feb 2023 10:00"):
+            with self.subTest(date_str=date_str):
+                with self.assertRaises(ValueError):
+                    _parse_match_datetime(date_str)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Tests for ScraperSession driver lifecycle (no browser: create_driver is mocked)
+"""
+
+import unittest
+from unittest import mock
+
+from selenium.common.exceptions import WebDriverException
+
+from getodd_module import scraper
+from getodd_module.scraper import ScraperSession
+
+
+class ScraperSessionTest(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(scraper, 'create_driver', side_effect=lambda *a, **k: mock.Mock())
+        self.create_driver = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(scraper, 'force_quit_driver')
+        self.force_quit_driver = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(scraper, 'scrape_match_and_odds_with_driver', return_value=[['row']])
+        self.scrape = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_context_manager_creates_and_quits_driver(self):
+        with ScraperSession(headless=True, worker_id=3) as session:
+            driver = session.driver
+            self.create_driver.assert_called_once_with(True, worker_id=3)
+
+        self.force_quit_driver.assert_called_once_with(driver, system_cleanup=False)
+        self.assertIsNone(session.driver)
+
+    def test_quits_driver_when_block_raises(self):
+        with self.assertRaises(RuntimeError):
+            with ScraperSession() as session:
+                driver = session.driver
+                raise RuntimeError('boom')
+
+        self.force_quit_driver.assert_called_once_with(driver, system_cleanup=False)
+
+    def test_close_is_idempotent(self):
+        session = ScraperSession()
+        session.close()
+        with session:
+            pass
+        session.close()
+
+        self.assertEqual(self.force_quit_driver.call_count, 1)
+
+    def test_scrape_reuses_driver(self):
+        with ScraperSession() as session:
+            self.assertEqual(session.scrape('u1', ['2.5']), [['row']])
+            session.scrape('u2', ['2.5'])
+
+        self.assertEqual(self.create_driver.call_count, 1)
+        self.assertEqual(self.scrape.call_count, 2)
+
+    def test_scrape_recreates_dead_driver_and_retries(self):
+        self.scrape.side_effect = [WebDriverException('chrome not reachable'), [['row']]]
+        with mock.patch.object(scraper, 'is_driver_alive', return_value=False):
+            with ScraperSession() as session:
+                dead = session.driver
+                self.assertEqual(session.scrape('u1', ['2.5']), [['row']])
+                self.assertIsNot(session.driver, dead)
+
+        self.assertEqual(self.create_driver.call_count, 2)
+        self.force_quit_driver.assert_any_call(dead, system_cleanup=False)
+
+    def test_scrape_retries_on_live_driver(self):
+        self.scrape.side_effect = [WebDriverException('stale'), [['row']]]
+        with mock.patch.object(scraper, 'is_driver_alive', return_value=True):
+            with ScraperSession() as session:
+                driver = session.driver
+                session.scrape('u1', ['2.5'])
+                self.assertIs(session.driver, driver)
+
+        self.assertEqual(self.create_driver.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()